@@ -39,7 +39,6 @@ from . import auth
 from . import exceptions
 from . import middlewares
 from . import ui
-from . import websocket
 from .app import Haru
 from .request import Request
 from .response import Response, redirect
@@ -62,3 +61,12 @@ version_info: VersionInfo = VersionInfo(
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 del logging, NamedTuple, Literal, VersionInfo
+
+
+def __getattr__(name: str):
+    # haru.websocket pulls in asyncio, ssl and threading; load it on first use.
+    if name == "websocket":
+        import importlib
+
+        return importlib.import_module(".websocket", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
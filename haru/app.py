@@ -5,9 +5,11 @@ It provides functionality to handle routing, middleware management, and request/
 
 import asyncio
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import (
     Callable,
     Dict,
+    Iterable,
     List,
     Any,
     Optional,
@@ -17,11 +19,13 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    TYPE_CHECKING,
 )
 
 from .router import Router
 from .request import Request
 from .response import Response
+from .wrappers import BytesWrapper, FileWrapper
 from .exceptions import (
     HTTPException,
     NotFound,
@@ -30,7 +34,9 @@ from .exceptions import (
 )
 from .blueprint import Blueprint
 from .middleware import Middleware
-from .websocket import WebSocketServer
+
+if TYPE_CHECKING:
+    from .websocket import WebSocketServer
 
 __all__ = ["Haru"]
 
@@ -46,7 +52,12 @@ class Haru:
     WebSocket support when running in WSGI mode by starting a separate WebSocket server.
     """
 
-    def __init__(self, import_name: str, asgi: bool = False):
+    def __init__(
+        self,
+        import_name: str,
+        asgi: bool = False,
+        io_executor: Optional[Executor] = None,
+    ):
         """
         Initialize the Haru application.
 
@@ -54,6 +65,11 @@ class Haru:
         :type import_name: str
         :param asgi: Flag to enable ASGI mode.
         :type asgi: bool
+        :param io_executor: The executor that file and byte stream responses are read in
+            under ASGI, unless they were given their own. A response being streamed only
+            holds one of its workers while reading ahead of the client, not while waiting
+            for a slow client. Defaults to a pool of 32 threads in ASGI mode.
+        :type io_executor: Optional[Executor]
         """
         self.import_name: str = import_name
         self.router: Router = Router()
@@ -61,7 +77,10 @@ class Haru:
         self.middleware: List[Middleware] = []
         self.error_handlers: Dict[Union[int, Type[Exception]], Callable] = {}
         self.asgi: bool = asgi
-        self.websocket_server: Optional[WebSocketServer] = None  # type: ignore
+        if io_executor is None and asgi:
+            io_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="haru-io")
+        self.io_executor: Optional[Executor] = io_executor
+        self.websocket_server: Optional["WebSocketServer"] = None  # type: ignore
         self.websocket_routes: Dict[str, Callable] = {}
         self.static_routes: List[Tuple[str, str, Optional[List[str]]]] = (
             []
@@ -235,6 +254,9 @@ class Haru:
             )
 
         if self.websocket_routes:
+            # Imported here so apps without WebSocket routes never load it
+            from .websocket import WebSocketServer
+
             ws_host = ws_host or host
             ws_port = ws_port or (port + 1)
             self.websocket_server = WebSocketServer(ws_host, ws_port)
@@ -256,7 +278,7 @@ class Haru:
 
     def wsgi_app(
         self, environ: Dict[str, Any], start_response: Callable
-    ) -> List[bytes]:
+    ) -> Iterable[bytes]:
         """
         WSGI application callable.
 
@@ -268,8 +290,8 @@ class Haru:
         :type environ: Dict[str, Any]
         :param start_response: The WSGI start_response callable.
         :type start_response: Callable
-        :return: The response body as a list of bytes.
-        :rtype: List[bytes]
+        :return: The response body as an iterable of bytes.
+        :rtype: Iterable[bytes]
         """
         try:
             # Read the request body
@@ -364,16 +386,18 @@ class Haru:
                     elif action == 'delete':
                         response.delete_cookie(key, path='/')
 
+            self._apply_range(request, response)
+
             # Send response
             status = f"{response.status_code} {self._http_status_message(response.status_code)}"
             response_headers = list(response.headers.items())
             start_response(status, response_headers)
-            content = response.get_content()
+            body = self._wsgi_body(environ, response)
 
             for mw in reversed(middlewares):
                 self._run_middleware_method_sync(mw.after_response, request, response)
 
-            return [content]
+            return body
 
         except Exception as e:
             # Error handling with correct status code
@@ -491,6 +515,8 @@ class Haru:
                 for mw in middlewares:
                     await self._maybe_async(mw.before_response, request, response)
 
+                self._apply_range(request, response)
+
                 await send(
                     {
                         "type": "http.response.start",
@@ -501,12 +527,7 @@ class Haru:
                         ],
                     }
                 )
-                await send(
-                    {
-                        "type": "http.response.body",
-                        "body": response.get_content(),
-                    }
-                )
+                await self._send_asgi_body(scope, send, response)
 
                 for mw in reversed(middlewares):
                     await self._maybe_async(mw.after_response, request, response)
@@ -577,6 +598,117 @@ class Haru:
         else:
             pass
 
+    def _apply_range(self, request: Request, response: Response) -> None:
+        """
+        Narrow a wrapped file sent in response to a GET request to the range of
+        bytes asked for by its Range header, if it has one.
+
+        :param request: The request being responded to.
+        :type request: Request
+        :param response: The response to send.
+        :type response: Response
+        """
+        if not isinstance(response, FileWrapper) or request.method != "GET":
+            return
+        range_header = request.headers.get("range")
+        if range_header:
+            response.apply_range(range_header, request.headers.get("if-range"))
+
+    def _wsgi_body(
+        self, environ: Dict[str, Any], response: Response
+    ) -> Iterable[bytes]:
+        """
+        Get the WSGI body of a response. A wrapped file that is streamed is given
+        to the server's ``wsgi.file_wrapper`` if it has one, which may send it with
+        sendfile.
+
+        :param environ: The WSGI environment dictionary.
+        :type environ: Dict[str, Any]
+        :param response: The response to send.
+        :type response: Response
+        :return: The response body as an iterable of bytes.
+        :rtype: Iterable[bytes]
+        """
+        content = response.get_content()
+        if isinstance(content, bytes):
+            return [content]
+        if isinstance(response, FileWrapper) and response.length is None:
+            file_wrapper = environ.get("wsgi.file_wrapper")
+            if file_wrapper is not None:
+                file = open(response.filepath, "rb")
+                file.seek(response.offset)
+                return file_wrapper(file, response.chunk_size)
+        # Streaming responses iterate over their own chunks. Their iterator is
+        # returned rather than the response, so that the server closes it, and
+        # the file it reads, as soon as the response ends or is aborted.
+        return iter(content)
+
+    async def _send_asgi_body(
+        self,
+        scope: Dict[str, Any],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        response: Response,
+    ) -> None:
+        """
+        Send the body of a response over ASGI. A wrapped file that is streamed is
+        sent with the ``http.response.pathsend`` or ``http.response.zerocopysend``
+        extension if the server supports one, so that it may use sendfile; other
+        streaming responses are sent chunk by chunk.
+
+        :param scope: The ASGI scope of the request.
+        :type scope: Dict[str, Any]
+        :param send: The send callable to send the response messages.
+        :type send: Callable
+        :param response: The response to send.
+        :type response: Response
+        """
+        content = response.get_content()
+        if isinstance(content, bytes):
+            await send({"type": "http.response.body", "body": content})
+            return
+
+        if isinstance(response, FileWrapper):
+            extensions = scope.get("extensions") or {}
+            whole_file = not response.offset and response.length is None
+            if whole_file and "http.response.pathsend" in extensions:
+                await send(
+                    {
+                        "type": "http.response.pathsend",
+                        "path": os.path.abspath(response.filepath),
+                    }
+                )
+                return
+            if "http.response.zerocopysend" in extensions:
+                message = {
+                    "type": "http.response.zerocopysend",
+                    "offset": response.offset,
+                }
+                if response.length is not None:
+                    message["count"] = response.length
+                with open(response.filepath, "rb") as file:
+                    message["file"] = file
+                    await send(message)
+                return
+
+        if isinstance(response, (FileWrapper, BytesWrapper)) and response.executor is None:
+            response.executor = self.io_executor
+        # Each chunk is held back until the next one arrives, so that the last
+        # one ends the body instead of an extra empty message.
+        pending = b""
+        chunks = (await response.get_async_content()).__aiter__()
+        try:
+            async for chunk in chunks:
+                if pending:
+                    await send({"type": "http.response.body", "body": pending, "more_body": True})
+                pending = chunk
+        finally:
+            # Close the stream now rather than when it is garbage collected, so
+            # that an aborted response releases its file and reader at once.
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await send({"type": "http.response.body", "body": pending})
+
     def asgi_app(self) -> Callable:
         """
         Returns the ASGI application callable.
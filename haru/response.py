@@ -4,7 +4,7 @@ The `Response` class is responsible for managing the response content, headers,
 and other properties that are sent back to the client after processing an HTTP request.
 """
 
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 import json
 from typing import Any, Dict, Optional
@@ -161,7 +161,7 @@ class Response:
         self.set_cookie(
             key,
             '',
-            expires=datetime.now(UTC) - timedelta(days=1),
+            expires=datetime.now(timezone.utc) - timedelta(days=1),
             path=path,
             domain=domain
         )
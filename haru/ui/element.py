@@ -3,8 +3,19 @@ This module provides classes for representing HTML elements and their structures
 """
 
 from __future__ import annotations
-from typing import Union, Optional, List, Dict
-import html
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    SupportsIndex,
+    Tuple,
+    Union,
+)
+import sys
 
 __all__ = [
     "Element",
@@ -134,11 +145,305 @@ __all__ = [
     "Xmp",
 ]
 
+_intern = sys.intern
+
+# Released elements waiting to be reused by `Element.acquire`, per class.
+_pools: Dict[type, List[Element]] = {}
+_POOL_LIMIT = 1024
+
+
+class _EmptyAttributes(dict):
+    """
+    The empty attributes shared by all elements created without attributes. It
+    cannot be modified, so that no attribute can leak into every element, and is
+    pickled and copied as the shared instance.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("the shared empty attributes cannot be modified")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    setdefault = update = pop = popitem = clear = _read_only
+
+    def __reduce__(self) -> str:
+        return "_NO_ATTRIBUTES"
+
+
+# Shared read-only stand-ins for elements without children or attributes. The
+# real containers are created on first access through the public properties.
+_NO_CHILDREN: tuple = ()
+_NO_ATTRIBUTES: Dict[str, Union[str, bool]] = _EmptyAttributes()
+
+
+def _escape(text: str) -> str:
+    """
+    Escapes HTML special characters, producing the same output as `html.escape`.
+    Each replacement is guarded by a membership test so that text without special
+    characters is returned without being copied.
+
+    :param text: The text to escape.
+    :type text: str
+    :return: The escaped text.
+    :rtype: str
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "'" in text:
+        text = text.replace("'", "&#x27;")
+    return text
+
+
+def _adopt_child(child: Element, owner: Element) -> None:
+    """
+    Makes `owner` the parent of an element. An element may be shared by several
+    elements, such as a header reused across pages; its previous parents are
+    kept so that modifying it still clears their render cache.
+
+    :param child: The element being added.
+    :param owner: The element it is added to.
+    """
+    previous = child.parent
+    if previous is not None and previous is not owner:
+        others = child._other_parents
+        if others is None:
+            child._other_parents = [previous]
+        elif previous not in others:
+            others.append(previous)
+        if others and owner in others:
+            others.remove(owner)
+    child.parent = owner
+
+
+def _disown_child(child: Element, owner: Element) -> None:
+    """
+    Removes `owner` from the parents of an element that is no longer one of its
+    children. The element falls back to another of its parents, if any.
+
+    :param child: The element that was removed.
+    :param owner: The element it was removed from.
+    """
+    others = child._other_parents
+    if child.parent is owner:
+        child.parent = others.pop() if others else None
+    elif others and owner in others:
+        others.remove(owner)
+
+
+class _NodeList(list):
+    """
+    A list of child nodes that keeps the parent links and the render cache of its
+    owner element in sync with mutations. The element children are also kept as a
+    separate tuple, built on demand, for traversals that skip text nodes.
+
+    :param owner: The element owning the children.
+    :type owner: Element
+    :param children: The initial children.
+    :type children: Iterable[Union[str, Element]]
+    """
+
+    __slots__ = ("_owner", "_elements")
+
+    def __init__(
+        self, owner: Element, children: Iterable[Union[str, Element]] = ()
+    ) -> None:
+        super().__init__(children)
+        self._owner = owner
+        self._elements: Optional[Tuple[Element, ...]] = None
+        for child in self:
+            if isinstance(child, Element):
+                _adopt_child(child, owner)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self._owner, list(self))
+
+    def elements(self) -> Tuple[Element, ...]:
+        """
+        Returns the element children, in order, without the text nodes.
+        """
+        elements = self._elements
+        if elements is None:
+            elements = self._elements = tuple(
+                child for child in self if isinstance(child, Element)
+            )
+        return elements
+
+    def _changed(self) -> None:
+        self._elements = None
+        self._owner._invalidate()
+
+    def _adopt(self, children: Iterable[Union[str, Element]]) -> None:
+        self._changed()
+        owner = self._owner
+        for child in children:
+            if isinstance(child, Element):
+                _adopt_child(child, owner)
+
+    def _disown(self, removed: Iterable[Union[str, Element]]) -> None:
+        # An element added more than once keeps its parent until its last removal.
+        owner = self._owner
+        for child in removed:
+            if isinstance(child, Element) and child not in self:
+                _disown_child(child, owner)
+
+    def append(self, child: Union[str, Element]) -> None:
+        self._adopt((child,))
+        super().append(child)
+
+    def extend(self, children: Iterable[Union[str, Element]]) -> None:
+        children = list(children)
+        self._adopt(children)
+        super().extend(children)
+
+    def insert(self, index: SupportsIndex, child: Union[str, Element]) -> None:
+        self._adopt((child,))
+        super().insert(index, child)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            removed = self[index]
+            value = list(value)
+            self._adopt(value)
+        else:
+            removed = (self[index],)
+            self._adopt((value,))
+        super().__setitem__(index, value)
+        self._disown(removed)
+
+    def __iadd__(self, children: Iterable[Union[str, Element]]) -> _NodeList:
+        self.extend(children)
+        return self
+
+    def __delitem__(self, index) -> None:
+        self._changed()
+        removed = self[index] if isinstance(index, slice) else (self[index],)
+        super().__delitem__(index)
+        self._disown(removed)
+
+    def __imul__(self, count: SupportsIndex) -> _NodeList:
+        self._changed()
+        removed = list(self)
+        super().__imul__(count)
+        self._disown(removed)
+        return self
+
+    def remove(self, child: Union[str, Element]) -> None:
+        del self[self.index(child)]
+
+    def pop(self, index: SupportsIndex = -1) -> Union[str, Element]:
+        self._changed()
+        child = super().pop(index)
+        self._disown((child,))
+        return child
+
+    def clear(self) -> None:
+        self._changed()
+        removed = list(self)
+        super().clear()
+        self._disown(removed)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._changed()
+        super().reverse()
+
+
+class _AttributeDict(dict):
+    """
+    A dictionary of HTML attributes that interns its keys and clears the render
+    cache of its owner element on mutation.
+
+    :param owner: The element owning the attributes.
+    :type owner: Element
+    :param attributes: The initial attributes.
+    :type attributes: Optional[Dict[str, Union[str, bool]]]
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self, owner: Element, attributes: Optional[Dict[str, Union[str, bool]]] = None
+    ) -> None:
+        super().__init__()
+        self._owner = owner
+        if attributes:
+            for key, value in attributes.items():
+                dict.__setitem__(self, _intern(key), value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self._owner, dict(self))
+
+    def __setitem__(self, key: str, value: Union[str, bool]) -> None:
+        self._owner._invalidate()
+        super().__setitem__(_intern(key), value)
+
+    def __delitem__(self, key: str) -> None:
+        self._owner._invalidate()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Dict[str, Union[str, bool]]) -> _AttributeDict:
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._owner._invalidate()
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, _intern(key), value)
+
+    def setdefault(self, key: str, default: Union[str, bool] = None) -> Union[str, bool]:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Union[str, bool]) -> Union[str, bool]:
+        self._owner._invalidate()
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, Union[str, bool]]:
+        self._owner._invalidate()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._owner._invalidate()
+        super().clear()
+
+
+def _render_child(child: Element, write: Callable[[str], None]) -> bool:
+    """
+    Writes a child element into the output of its parent. Children whose class
+    overrides `render` are rendered through their override, whose output may
+    change from one call to the next.
+
+    :param child: The child element.
+    :param write: The callable receiving the fragments.
+    :return: Whether the output of the child can be cached.
+    """
+    if type(child).render is Element.render:
+        return child._render_into(write)
+    write(child.render())
+    return False
+
 
 class Element:
     """
     A base class for representing an HTML element.
 
+    The rendered HTML is cached on the element that `render` is called on, and is
+    reused until the element or one of its descendants is modified through its
+    `tag`, `raw`, `attributes` or `children`. Elements with a descendant whose
+    class overrides `render`, or with text content that is not a str, are not
+    cached, as their output may change without them being modified.
+
     :param tag: The HTML tag name for the element (e.g., 'div', 'button').
     :type tag: str
     :param args: Children elements or text content for the HTML element.
@@ -149,6 +454,39 @@ class Element:
     :type raw: bool
     """
 
+    __slots__ = (
+        "_tag",
+        "_attributes",
+        "_raw",
+        "_children",
+        "parent",
+        "_other_parents",
+        "_cached",
+    )
+
+    #: The tag name bound to the class through ``class X(Element, tag=...)``.
+    fixed_tag: ClassVar[Optional[str]] = None
+
+    def __init_subclass__(cls, tag: Optional[str] = None, **kwargs: Any) -> None:
+        """
+        Binds a subclass to a fixed HTML tag when declared with a `tag` keyword,
+        e.g. ``class Card(Element, tag="div")``. Unless the subclass defines its
+        own `__init__`, one is installed that fills in the element directly,
+        without going through `Element.__init__`.
+
+        :param tag: The HTML tag name rendered by the subclass.
+        :type tag: Optional[str]
+        """
+        super().__init_subclass__(**kwargs)
+        if tag is None:
+            return
+        tag = _intern(tag)
+        cls.fixed_tag = tag
+        if "__init__" not in cls.__dict__:
+            __init__ = _fixed_tag_init(tag, issubclass(cls, SelfClosingElement))
+            __init__.__qualname__ = f"{cls.__qualname__}.__init__"
+            cls.__init__ = __init__
+
     def __init__(
         self,
         tag: str,
@@ -156,39 +494,199 @@ class Element:
         attributes: Optional[dict[str, Union[str, bool]]] = None,
         raw: bool = False,
     ) -> None:
-        self.tag = tag
-        self.attributes = attributes if attributes else {}
-        self.raw = raw
-        self.children: List[Union[str, Element]] = list(args)
-        self.parent: Optional[Element] = None
-
-        # Set parent for child elements
-        for child in self.children:
-            if isinstance(child, Element):
-                child.parent = self
+        self._tag = _intern(tag)
+        self._attributes = (
+            _AttributeDict(self, attributes) if attributes else _NO_ATTRIBUTES
+        )
+        self._raw = raw
+        self._cached = None
+        self.parent = None
+        self._other_parents = None
+        self._children = _NodeList(self, args) if args else _NO_CHILDREN
+
+    @property
+    def tag(self) -> str:
+        """
+        The HTML tag name of the element.
+        """
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: str) -> None:
+        self._invalidate()
+        self._tag = _intern(tag)
+
+    @property
+    def attributes(self) -> Dict[str, Union[str, bool]]:
+        """
+        The HTML attributes of the element.
+        """
+        if type(self._attributes) is not _AttributeDict:
+            self._attributes = _AttributeDict(self, self._attributes)
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: Optional[Dict[str, Union[str, bool]]]) -> None:
+        self._invalidate()
+        self._attributes = _AttributeDict(self, attributes)
+
+    @property
+    def raw(self) -> bool:
+        """
+        Whether the content is rendered as raw HTML without escaping.
+        """
+        return self._raw
+
+    @raw.setter
+    def raw(self, raw: bool) -> None:
+        self._invalidate()
+        self._raw = raw
+
+    @property
+    def children(self) -> List[Union[str, Element]]:
+        """
+        The children elements and text content of the element.
+        """
+        if type(self._children) is not _NodeList:
+            self._children = _NodeList(self, self._children)
+        return self._children
+
+    @children.setter
+    def children(self, children: Iterable[Union[str, Element]]) -> None:
+        self._invalidate()
+        removed = self._children
+        self._children = _NodeList(self, children)
+        if type(removed) is _NodeList:
+            self._children._disown(removed)
+
+    def _invalidate(self) -> None:
+        """
+        Clears the cached render output of the element and all of its ancestors.
+        """
+        node = self
+        while node is not None:
+            node._cached = None
+            others = node._other_parents
+            if others:
+                for other in others:
+                    other._invalidate()
+            node = node.parent
 
     def render(self) -> str:
-        # Render attributes, handling boolean attributes
-        attrs = " ".join(
-            f"{key}" if isinstance(value, bool) and value else f'{key}="{value}"'
-            for key, value in self.attributes.items()
-            if not (isinstance(value, bool) and not value)
-        )
-        opening_tag = f"<{self.tag} {attrs}>" if attrs else f"<{self.tag}>"
-        closing_tag = f"</{self.tag}>"
-
-        # Render child elements
-        content = "".join(
-            [
-                (
-                    child.render()
-                    if isinstance(child, Element)
-                    else (str(child) if self.raw else html.escape(str(child)))
-                )
-                for child in self.children
-            ]
-        )
-        return f"{opening_tag}{content}{closing_tag}"
+        """
+        Renders the element and its children as an HTML string.
+
+        :return: The rendered HTML.
+        """
+        if self._cached is not None:
+            return self._cached
+        out: List[str] = []
+        if not self._render_into(out.append):
+            return "".join(out)
+        self._cached = "".join(out)
+        return self._cached
+
+    def freeze(self) -> Element:
+        """
+        Pre-renders the element so that rendering it, or any element containing it,
+        reuses the stored HTML instead of walking its subtree again. Useful for
+        constant parts of a page, such as a shared header, that are built once and
+        rendered on every request. Modifying the element or its descendants
+        discards the stored HTML. Elements that are not cached, as described on
+        the class, are still rendered each time.
+
+        :return: The element itself.
+        """
+        self.render()
+        return self
+
+    def render_to(self, write: Callable[[str], None]) -> None:
+        """
+        Renders the element and its children by passing each HTML fragment to
+        `write` as it is produced, without building the whole document in memory.
+        An element whose class overrides `render` is written as one fragment.
+
+        :param write: A callable receiving the rendered fragments, such as the
+            `write` method of a file or response stream.
+        """
+        _render_child(self, write)
+
+    def render_bytes(self, encoding: str = "utf-8") -> bytes:
+        """
+        Renders the element and its children as encoded HTML.
+
+        :param encoding: The encoding of the output.
+        :return: The rendered HTML as bytes.
+        """
+        if type(self).render is not Element.render:
+            return self.render().encode(encoding)
+        if self._cached is not None:
+            return self._cached.encode(encoding)
+        buffer = bytearray()
+        extend = buffer.extend
+        self._render_into(lambda fragment: extend(fragment.encode(encoding)))
+        return bytes(buffer)
+
+    def _render_into(self, write: Callable[[str], None]) -> bool:
+        """
+        Writes the rendered fragments of the element.
+
+        :param write: The callable receiving the fragments.
+        :return: Whether the output can be cached.
+        """
+        if self._cached is not None:
+            write(self._cached)
+            return True
+        cacheable = True
+        tag = self._tag
+        write("<")
+        write(tag)
+        self._render_attributes(write)
+        write(">")
+        if self._raw:
+            for child in self._children:
+                if isinstance(child, Element):
+                    if not _render_child(child, write):
+                        cacheable = False
+                elif type(child) is str:
+                    write(child)
+                else:
+                    write(str(child))
+                    cacheable = False
+        else:
+            for child in self._children:
+                if isinstance(child, Element):
+                    if not _render_child(child, write):
+                        cacheable = False
+                elif type(child) is str:
+                    write(_escape(child))
+                else:
+                    write(_escape(str(child)))
+                    cacheable = False
+        write("</")
+        write(tag)
+        write(">")
+        return cacheable
+
+    def _render_attributes(self, write: Callable[[str], None]) -> None:
+        """
+        Writes the rendered attributes of the element.
+        Boolean attributes are rendered by name only when true and omitted when false.
+
+        :param write: The callable receiving the fragments.
+        """
+        for key, value in self._attributes.items():
+            kind = type(value)
+            if kind is bool:
+                if value:
+                    write(" ")
+                    write(key)
+            else:
+                write(" ")
+                write(key)
+                write('="')
+                write(value if kind is str else str(value))
+                write('"')
 
     def append_child(self, child: Union[str, Element]) -> None:
         """
@@ -196,8 +694,6 @@ class Element:
 
         :param child: The child element or text to append.
         """
-        if isinstance(child, Element):
-            child.parent = self
         self.children.append(child)
 
     def remove_child(self, child: Union[str, Element]) -> None:
@@ -205,10 +701,121 @@ class Element:
         Removes a child element or text from the current element.
 
         :param child: The child element or text to remove.
+        :raises ValueError: If the child is not a child of the current element.
+        """
+        children = self._children
+        for index, node in enumerate(children):
+            if node is child:
+                del children[index]
+                break
+        else:
+            raise ValueError(f"{child!r} is not a child of this element")
+
+    @classmethod
+    def acquire(cls, *args: Any, **kwargs: Any) -> Element:
+        """
+        Creates an element like calling the class, reusing an instance previously
+        returned by `release` when one is available.
+
+        :param args: The positional arguments of the class constructor.
+        :param kwargs: The keyword arguments of the class constructor.
+        :return: The initialized element.
+        """
+        pool = _pools.get(cls)
+        element = pool.pop() if pool else cls.__new__(cls)
+        element.__init__(*args, **kwargs)
+        return element
+
+    def _clone(self) -> Element:
+        """
+        Returns a detached deep copy of the element that shares the cached render
+        output of the original. Only the slots defined by Element are copied.
+
+        :return: The copied element.
         """
-        self.children.remove(child)
-        if isinstance(child, Element):
-            child.parent = None
+        clone = object.__new__(type(self))
+        clone._tag = self._tag
+        clone._raw = self._raw
+        clone._cached = self._cached
+        clone.parent = None
+        clone._other_parents = None
+        clone._attributes = (
+            _AttributeDict(clone, self._attributes)
+            if self._attributes
+            else _NO_ATTRIBUTES
+        )
+        clone._children = (
+            _NodeList(
+                clone,
+                [
+                    child._clone() if isinstance(child, Element) else child
+                    for child in self._children
+                ],
+            )
+            if self._children
+            else _NO_CHILDREN
+        )
+        return clone
+
+    def __copy__(self) -> Element:
+        """
+        Returns a detached copy of the element. Its descendants are copied too,
+        so that modifying them does not affect the original.
+
+        :return: The copied element.
+        """
+        clone = self._clone()
+        for cls in type(self).__mro__:
+            if cls is Element:
+                break
+            slots = cls.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if hasattr(self, name):
+                    setattr(clone, name, getattr(self, name))
+        if hasattr(self, "__dict__"):
+            clone.__dict__.update(self.__dict__)
+        return clone
+
+    def release(self) -> None:
+        """
+        Detaches the element from its parents and returns it, along with its
+        descendant elements, to the pool used by `acquire`. Descendants that are
+        also children of elements outside of it are only detached from it. The
+        released elements must not be used afterwards; releasing one again has
+        no effect.
+        """
+        if self._tag is None:
+            return
+        for parent in (self.parent, *(self._other_parents or ())):
+            if parent is None:
+                continue
+            try:
+                parent.remove_child(self)
+            except ValueError:
+                # The parent link was left behind by an earlier modification.
+                pass
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._tag is None:
+                # Listed more than once among the children of its parent
+                continue
+            for child in node._children:
+                if not isinstance(child, Element) or child._tag is None:
+                    continue
+                if child._other_parents or child.parent is not node:
+                    _disown_child(child, node)
+                else:
+                    stack.append(child)
+            node._tag = None
+            node._children = _NO_CHILDREN
+            node._attributes = _NO_ATTRIBUTES
+            node._cached = None
+            node.parent = None
+            node._other_parents = None
+            pool = _pools.setdefault(type(node), [])
+            if len(pool) < _POOL_LIMIT:
+                pool.append(node)
 
     def get_element_by_id(self, element_id: str) -> Optional[Element]:
         """
@@ -217,12 +824,13 @@ class Element:
         :param element_id: The ID to search for.
         :return: The Element with the matching ID, or None if not found.
         """
-        if self.attributes.get("id") == element_id:
+        if self._attributes.get("id") == element_id:
             return self
-        for child in self._child_elements():
-            result = child.get_element_by_id(element_id)
-            if result:
-                return result
+        if self._children:
+            for child in self._children.elements():
+                result = child.get_element_by_id(element_id)
+                if result:
+                    return result
         return None
 
     def get_elements_by_class_name(self, class_name: str) -> List[Element]:
@@ -233,11 +841,12 @@ class Element:
         :return: A list of Elements with the matching class name.
         """
         elements = []
-        classes = self.attributes.get("class", "").split()
+        classes = self._attributes.get("class", "").split()
         if class_name in classes:
             elements.append(self)
-        for child in self._child_elements():
-            elements.extend(child.get_elements_by_class_name(class_name))
+        if self._children:
+            for child in self._children.elements():
+                elements.extend(child.get_elements_by_class_name(class_name))
         return elements
 
     def query_selector(self, selector: str) -> Optional[Element]:
@@ -263,22 +872,22 @@ class Element:
     ) -> Union[Optional[Element], List[Element]]:
         # Simple selector parsing (supports tag, #id, .class)
         elements = []
-        selector = selector.strip()
+        selector = _intern(selector.strip())
         if selector.startswith("#"):
-            element = self.get_element_by_id(selector[1:])
+            element = self.get_element_by_id(_intern(selector[1:]))
             if element:
                 return element if first_only else [element]
             else:
                 return None if first_only else []
         elif selector.startswith("."):
-            elements = self.get_elements_by_class_name(selector[1:])
+            elements = self.get_elements_by_class_name(_intern(selector[1:]))
             return elements[0] if first_only and elements else elements
         else:
-            if self.tag == selector:
+            if self._tag == selector:
                 elements.append(self)
                 if first_only:
                     return self
-            for child in self._child_elements():
+            for child in self._children.elements() if self._children else ():
                 result = child._query_selector(selector, first_only)
                 if result:
                     if first_only:
@@ -293,7 +902,7 @@ class Element:
 
         :return: A list of child Elements.
         """
-        return [child for child in self.children if isinstance(child, Element)]
+        return list(self._children.elements()) if self._children else []
 
     # Property to get the parent element
     @property
@@ -326,1715 +935,230 @@ class SelfClosingElement(Element):
     :type attributes: Optional[Dict[str, Union[str, bool]]]
     """
 
-    def render(self) -> str:
-        attrs = " ".join(
-            f"{key}" if isinstance(value, bool) and value else f'{key}="{value}"'
-            for key, value in self.attributes.items()
-            if not (isinstance(value, bool) and not value)
-        )
-        return f"<{self.tag} {attrs} />" if attrs else f"<{self.tag} />"
-
-
-class A(Element):
-    """
-    Represents an anchor HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("a", *args, attributes=attributes)
-
-
-class Abbr(Element):
-    """
-    Represents an abbreviation HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("abbr", *args, attributes=attributes)
-
-
-class Acronym(Element):
-    """
-    Represents an acronym HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("acronym", *args, attributes=attributes)
-
-
-class Address(Element):
-    """
-    Represents an address HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("address", *args, attributes=attributes)
-
-
-class Area(SelfClosingElement):
-    """
-    Represents an area HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("area", attributes=attributes)
-
-
-class Article(Element):
-    """
-    Represents an article HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("article", *args, attributes=attributes)
-
-
-class Aside(Element):
-    """
-    Represents an aside HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("aside", *args, attributes=attributes)
-
-
-class Audio(Element):
-    """
-    Represents an audio HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("audio", *args, attributes=attributes)
-
-
-class B(Element):
-    """
-    Represents a b HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("b", *args, attributes=attributes)
-
-
-class Base(Element):
-    """
-    Represents a base HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("base", *args, attributes=attributes)
-
-
-class Bdi(Element):
-    """
-    Represents a bdi HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("bdi", *args, attributes=attributes)
-
-
-class Bdo(Element):
-    """
-    Represents a bdo HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("bdo", *args, attributes=attributes)
-
-
-class Big(Element):
-    """
-    Represents a big HTML element.
-    """
+    __slots__ = ()
 
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("big", *args, attributes=attributes)
+    def _render_into(self, write: Callable[[str], None]) -> bool:
+        write("<")
+        write(self._tag)
+        self._render_attributes(write)
+        write(" />")
+        return True
 
 
-class Blockquote(Element):
-    """
-    Represents a blockquote HTML element.
+def _fixed_tag_init(tag: str, self_closing: bool) -> Callable[..., None]:
     """
+    Builds the `__init__` of an Element subclass bound to a fixed tag. It sets
+    the slots itself, with the tag bound as a constant, instead of forwarding
+    to `Element.__init__`; self-closing elements never get children.
 
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("blockquote", *args, attributes=attributes)
-
-
-class Body(Element):
-    """
-    Represents a body HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("body", *args, attributes=attributes)
-
-
-class Br(SelfClosingElement):
-    """
-    Represents a br HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("br", attributes=attributes)
-
-
-class Button(Element):
-    """
-    Represents a button HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("button", *args, attributes=attributes)
-
-
-class Canvas(Element):
-    """
-    Represents a canvas HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("canvas", *args, attributes=attributes)
-
-
-class Caption(Element):
-    """
-    Represents a caption HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("caption", *args, attributes=attributes)
-
-
-class Center(Element):
-    """
-    Represents a center HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("center", *args, attributes=attributes)
-
-
-class Cite(Element):
-    """
-    Represents a cite HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("cite", *args, attributes=attributes)
-
-
-class Code(Element):
-    """
-    Represents a code HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("code", *args, attributes=attributes)
-
-
-class Col(SelfClosingElement):
-    """
-    Represents a col HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("col", attributes=attributes)
-
-
-class Colgroup(Element):
-    """
-    Represents a colgroup HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("colgroup", *args, attributes=attributes)
-
-
-class Data(Element):
-    """
-    Represents a data HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("data", *args, attributes=attributes)
-
-
-class Datalist(Element):
-    """
-    Represents a datalist HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("datalist", *args, attributes=attributes)
-
-
-class Dd(Element):
-    """
-    Represents a dd HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("dd", *args, attributes=attributes)
-
-
-class Del(Element):
-    """
-    Represents a del HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("del", *args, attributes=attributes)
-
-
-class Details(Element):
-    """
-    Represents a details HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("details", *args, attributes=attributes)
-
-
-class Dfn(Element):
-    """
-    Represents a dfn HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("dfn", *args, attributes=attributes)
-
-
-class Dialog(Element):
-    """
-    Represents a dialog HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("dialog", *args, attributes=attributes)
-
-
-class Dir(Element):
-    """
-    Represents a dir HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("dir", *args, attributes=attributes)
-
-
-class Div(Element):
-    """
-    Represents a div HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("div", *args, attributes=attributes)
-
-
-class Dl(Element):
-    """
-    Represents a dl HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("dl", *args, attributes=attributes)
-
-
-class Dt(Element):
-    """
-    Represents a dt HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("dt", *args, attributes=attributes)
-
-
-class Em(Element):
-    """
-    Represents an em HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("em", *args, attributes=attributes)
-
-
-class Embed(Element):
-    """
-    Represents an embed HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("embed", *args, attributes=attributes)
-
-
-class Fencedframe(Element):
-    """
-    Represents a fencedframe HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("fencedframe", *args, attributes=attributes)
-
-
-class Fieldset(Element):
-    """
-    Represents a fieldset HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("fieldset", *args, attributes=attributes)
-
-
-class Figcaption(Element):
-    """
-    Represents a figcaption HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("figcaption", *args, attributes=attributes)
-
-
-class Figure(Element):
-    """
-    Represents a figure HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("figure", *args, attributes=attributes)
-
-
-class Font(Element):
-    """
-    Represents a font HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("font", *args, attributes=attributes)
-
-
-class Footer(Element):
-    """
-    Represents a footer HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("footer", *args, attributes=attributes)
-
-
-class Form(Element):
-    """
-    Represents a form HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("form", *args, attributes=attributes)
-
-
-class Frame(Element):
-    """
-    Represents a frame HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("frame", *args, attributes=attributes)
-
-
-class Frameset(Element):
-    """
-    Represents a frameset HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("frameset", *args, attributes=attributes)
-
-
-class H1(Element):
-    """
-    Represents an h1 HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("h1", *args, attributes=attributes)
-
-
-class H2(Element):
-    """
-    Represents an h2 HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("h2", *args, attributes=attributes)
-
-
-class H3(Element):
-    """
-    Represents an h3 HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("h3", *args, attributes=attributes)
-
-
-class H4(Element):
-    """
-    Represents an h4 HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("h4", *args, attributes=attributes)
-
-
-class H5(Element):
-    """
-    Represents an h5 HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("h5", *args, attributes=attributes)
-
-
-class H6(Element):
-    """
-    Represents an h6 HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("h6", *args, attributes=attributes)
-
-
-class Head(Element):
-    """
-    Represents a head HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("head", *args, attributes=attributes)
-
-
-class Header(Element):
-    """
-    Represents a header HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("header", *args, attributes=attributes)
-
-
-class Hgroup(Element):
-    """
-    Represents a hgroup HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("hgroup", *args, attributes=attributes)
-
-
-class Hr(SelfClosingElement):
-    """
-    Represents an hr HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("hr", attributes=attributes)
-
-
-class Html(Element):
-    """
-    Represents an html HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("html", *args, attributes=attributes)
-
-
-class I(Element):  # noqa
-    """
-    Represents an i HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("i", *args, attributes=attributes)
-
-
-class Iframe(Element):
-    """
-    Represents an iframe HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("iframe", *args, attributes=attributes)
-
-
-class Img(SelfClosingElement):
-    """
-    Represents an img HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("img", attributes=attributes)
-
-
-class Input(SelfClosingElement):
-    """
-    Represents an input HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("input", attributes=attributes)
-
-
-class Ins(Element):
-    """
-    Represents an ins HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("ins", *args, attributes=attributes)
-
-
-class Kbd(Element):
-    """
-    Represents a kbd HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("kbd", *args, attributes=attributes)
-
-
-class Label(Element):
-    """
-    Represents a label HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("label", *args, attributes=attributes)
-
-
-class Legend(Element):
-    """
-    Represents a legend HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("legend", *args, attributes=attributes)
-
-
-class Li(Element):
-    """
-    Represents a li HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("li", *args, attributes=attributes)
-
-
-class Link(SelfClosingElement):
-    """
-    Represents a link HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("link", attributes=attributes)
-
-
-class Main(Element):
-    """
-    Represents a main HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("main", *args, attributes=attributes)
-
-
-class Map(Element):
-    """
-    Represents a map HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("map", *args, attributes=attributes)
-
-
-class Mark(Element):
-    """
-    Represents a mark HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("mark", *args, attributes=attributes)
-
-
-class Marquee(Element):
-    """
-    Represents a marquee HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("marquee", *args, attributes=attributes)
-
-
-class Menu(Element):
-    """
-    Represents a menu HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("menu", *args, attributes=attributes)
-
-
-class Meta(SelfClosingElement):
-    """
-    Represents a meta HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("meta", attributes=attributes)
-
-
-class Meter(Element):
-    """
-    Represents a meter HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("meter", *args, attributes=attributes)
-
-
-class Nav(Element):
-    """
-    Represents a nav HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("nav", *args, attributes=attributes)
-
-
-class Nobr(Element):
-    """
-    Represents a nobr HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("nobr", *args, attributes=attributes)
-
-
-class Noembed(Element):
-    """
-    Represents a noembed HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("noembed", *args, attributes=attributes)
-
-
-class Noframes(Element):
-    """
-    Represents a noframes HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("noframes", *args, attributes=attributes)
-
-
-class Noscript(Element):
-    """
-    Represents a noscript HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("noscript", *args, attributes=attributes)
-
-
-class Object(Element):
-    """
-    Represents an object HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("object", *args, attributes=attributes)
-
-
-class Ol(Element):
-    """
-    Represents an ol HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("ol", *args, attributes=attributes)
-
-
-class Optgroup(Element):
-    """
-    Represents an optgroup HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("optgroup", *args, attributes=attributes)
-
-
-class Option(Element):
-    """
-    Represents an option HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("option", *args, attributes=attributes)
-
-
-class Output(Element):
-    """
-    Represents an output HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("output", *args, attributes=attributes)
-
-
-class P(Element):
-    """
-    Represents a p HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("p", *args, attributes=attributes)
-
-
-class Param(SelfClosingElement):
-    """
-    Represents a param HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("param", attributes=attributes)
-
-
-class Picture(Element):
-    """
-    Represents a picture HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("picture", *args, attributes=attributes)
-
-
-class Plaintext(Element):
-    """
-    Represents a plaintext HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("plaintext", *args, attributes=attributes)
-
-
-class Portal(Element):
-    """
-    Represents a portal HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("portal", *args, attributes=attributes)
-
-
-class Pre(Element):
-    """
-    Represents a pre HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("pre", *args, attributes=attributes)
-
-
-class Progress(Element):
-    """
-    Represents a progress HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("progress", *args, attributes=attributes)
-
-
-class Q(Element):
-    """
-    Represents a q HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("q", *args, attributes=attributes)
-
-
-class Rb(Element):
-    """
-    Represents a rb HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("rb", *args, attributes=attributes)
-
-
-class Rp(Element):
-    """
-    Represents a rp HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("rp", *args, attributes=attributes)
-
-
-class Rt(Element):
-    """
-    Represents a rt HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("rt", *args, attributes=attributes)
-
-
-class Rtc(Element):
-    """
-    Represents a rtc HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("rtc", *args, attributes=attributes)
-
-
-class Ruby(Element):
-    """
-    Represents a ruby HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("ruby", *args, attributes=attributes)
-
-
-class S(Element):
-    """
-    Represents an s HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("s", *args, attributes=attributes)
-
-
-class Samp(Element):
-    """
-    Represents a samp HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("samp", *args, attributes=attributes)
-
-
-class Script(Element):
-    """
-    Represents a script HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("script", *args, attributes=attributes)
-
-
-class Search(Element):
-    """
-    Represents a search HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("search", *args, attributes=attributes)
-
-
-class Section(Element):
-    """
-    Represents a section HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("section", *args, attributes=attributes)
-
-
-class Select(Element):
-    """
-    Represents a select HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("select", *args, attributes=attributes)
-
-
-class Slot(Element):
-    """
-    Represents a slot HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("slot", *args, attributes=attributes)
-
-
-class Small(Element):
-    """
-    Represents a small HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("small", *args, attributes=attributes)
-
-
-class Source(SelfClosingElement):
-    """
-    Represents a source HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("source", attributes=attributes)
-
-
-class Span(Element):
-    """
-    Represents a span HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("span", *args, attributes=attributes)
-
-
-class Strike(Element):
-    """
-    Represents a strike HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("strike", *args, attributes=attributes)
-
-
-class Strong(Element):
-    """
-    Represents a strong HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("strong", *args, attributes=attributes)
-
-
-class Style(Element):
-    """
-    Represents a style HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("style", *args, attributes=attributes)
-
-
-class Sub(Element):
-    """
-    Represents a sub HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("sub", *args, attributes=attributes)
-
-
-class Summary(Element):
-    """
-    Represents a summary HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("summary", *args, attributes=attributes)
-
-
-class Sup(Element):
-    """
-    Represents a sup HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("sup", *args, attributes=attributes)
-
-
-class Svg(Element):
-    """
-    Represents an svg HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("svg", *args, attributes=attributes)
-
-
-class Table(Element):
-    """
-    Represents a table HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("table", *args, attributes=attributes)
-
-
-class Tbody(Element):
-    """
-    Represents a tbody HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("tbody", *args, attributes=attributes)
-
-
-class Td(Element):
-    """
-    Represents a td HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("td", *args, attributes=attributes)
-
-
-class Template(Element):
-    """
-    Represents a template HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("template", *args, attributes=attributes)
-
-
-class Textarea(Element):
-    """
-    Represents a textarea HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("textarea", *args, attributes=attributes)
-
-
-class Tfoot(Element):
-    """
-    Represents a tfoot HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("tfoot", *args, attributes=attributes)
-
-
-class Th(Element):
-    """
-    Represents a th HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("th", *args, attributes=attributes)
-
-
-class Thead(Element):
-    """
-    Represents a thead HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("thead", *args, attributes=attributes)
-
-
-class Time(Element):
-    """
-    Represents a time HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("time", *args, attributes=attributes)
-
-
-class Title(Element):
-    """
-    Represents a title HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("title", *args, attributes=attributes)
-
-
-class Tr(Element):
-    """
-    Represents a tr HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("tr", *args, attributes=attributes)
-
-
-class Track(SelfClosingElement):
-    """
-    Represents a track HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("track", attributes=attributes)
-
-
-class Tt(Element):
-    """
-    Represents a tt HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("tt", *args, attributes=attributes)
-
-
-class U(Element):
-    """
-    Represents a u HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("u", *args, attributes=attributes)
-
-
-class Ul(Element):
-    """
-    Represents an ul HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("ul", *args, attributes=attributes)
-
-
-class Var(Element):
-    """
-    Represents a var HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("var", *args, attributes=attributes)
-
-
-class Video(Element):
-    """
-    Represents a video HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("video", *args, attributes=attributes)
-
-
-class Wbr(SelfClosingElement):
-    """
-    Represents a wbr HTML element.
-    """
-
-    def __init__(
-        self, attributes: Optional[Dict[str, Union[str, bool]]] = None
-    ) -> None:
-        super().__init__("wbr", attributes=attributes)
-
-
-class Xmp(Element):
-    """
-    Represents an xmp HTML element.
-    """
-
-    def __init__(
-        self,
-        *args: Union[str, Element],
-        attributes: Optional[Dict[str, Union[str, bool]]] = None,
-    ) -> None:
-        super().__init__("xmp", *args, attributes=attributes)
+    :param tag: The interned HTML tag name.
+    :type tag: str
+    :param self_closing: Whether the element is a self-closing element.
+    :type self_closing: bool
+    :return: The `__init__` function.
+    """
+    if self_closing:
+
+        def __init__(
+            self: Element, attributes: Optional[Dict[str, Union[str, bool]]] = None
+        ) -> None:
+            self._tag = tag
+            self._attributes = (
+                _AttributeDict(self, attributes) if attributes else _NO_ATTRIBUTES
+            )
+            self._raw = False
+            self._cached = None
+            self.parent = None
+            self._other_parents = None
+            self._children = _NO_CHILDREN
+
+    else:
+
+        def __init__(
+            self: Element,
+            *args: Union[str, Element],
+            attributes: Optional[Dict[str, Union[str, bool]]] = None,
+        ) -> None:
+            self._tag = tag
+            self._attributes = (
+                _AttributeDict(self, attributes) if attributes else _NO_ATTRIBUTES
+            )
+            self._raw = False
+            self._cached = None
+            self.parent = None
+            self._other_parents = None
+            self._children = _NodeList(self, args) if args else _NO_CHILDREN
+
+    return __init__
+
+
+def _make_tag(name: str, tag: str, doc: str, self_closing: bool = False) -> type:
+    """
+    Creates an Element subclass bound to a fixed HTML tag.
+
+    :param name: The name of the generated class (e.g., 'Div').
+    :type name: str
+    :param tag: The HTML tag name rendered by the class (e.g., 'div').
+    :type tag: str
+    :param doc: The docstring of the generated class.
+    :type doc: str
+    :param self_closing: Whether the element is a self-closing element.
+    :type self_closing: bool
+    :return: The generated Element subclass.
+    :rtype: type
+    """
+    return type(
+        name,
+        (SelfClosingElement if self_closing else Element,),
+        {"__slots__": (), "__doc__": f"\n    {doc}\n    ", "__module__": __name__},
+        tag=tag,
+    )
+
+
+A = _make_tag("A", "a", "Represents an anchor HTML element.")
+Abbr = _make_tag("Abbr", "abbr", "Represents an abbreviation HTML element.")
+Acronym = _make_tag("Acronym", "acronym", "Represents an acronym HTML element.")
+Address = _make_tag("Address", "address", "Represents an address HTML element.")
+Area = _make_tag("Area", "area", "Represents an area HTML element.", self_closing=True)
+Article = _make_tag("Article", "article", "Represents an article HTML element.")
+Aside = _make_tag("Aside", "aside", "Represents an aside HTML element.")
+Audio = _make_tag("Audio", "audio", "Represents an audio HTML element.")
+B = _make_tag("B", "b", "Represents a b HTML element.")
+Base = _make_tag("Base", "base", "Represents a base HTML element.")
+Bdi = _make_tag("Bdi", "bdi", "Represents a bdi HTML element.")
+Bdo = _make_tag("Bdo", "bdo", "Represents a bdo HTML element.")
+Big = _make_tag("Big", "big", "Represents a big HTML element.")
+Blockquote = _make_tag(
+    "Blockquote", "blockquote", "Represents a blockquote HTML element."
+)
+Body = _make_tag("Body", "body", "Represents a body HTML element.")
+Br = _make_tag("Br", "br", "Represents a br HTML element.", self_closing=True)
+Button = _make_tag("Button", "button", "Represents a button HTML element.")
+Canvas = _make_tag("Canvas", "canvas", "Represents a canvas HTML element.")
+Caption = _make_tag("Caption", "caption", "Represents a caption HTML element.")
+Center = _make_tag("Center", "center", "Represents a center HTML element.")
+Cite = _make_tag("Cite", "cite", "Represents a cite HTML element.")
+Code = _make_tag("Code", "code", "Represents a code HTML element.")
+Col = _make_tag("Col", "col", "Represents a col HTML element.", self_closing=True)
+Colgroup = _make_tag("Colgroup", "colgroup", "Represents a colgroup HTML element.")
+Data = _make_tag("Data", "data", "Represents a data HTML element.")
+Datalist = _make_tag("Datalist", "datalist", "Represents a datalist HTML element.")
+Dd = _make_tag("Dd", "dd", "Represents a dd HTML element.")
+Del = _make_tag("Del", "del", "Represents a del HTML element.")
+Details = _make_tag("Details", "details", "Represents a details HTML element.")
+Dfn = _make_tag("Dfn", "dfn", "Represents a dfn HTML element.")
+Dialog = _make_tag("Dialog", "dialog", "Represents a dialog HTML element.")
+Dir = _make_tag("Dir", "dir", "Represents a dir HTML element.")
+Div = _make_tag("Div", "div", "Represents a div HTML element.")
+Dl = _make_tag("Dl", "dl", "Represents a dl HTML element.")
+Dt = _make_tag("Dt", "dt", "Represents a dt HTML element.")
+Em = _make_tag("Em", "em", "Represents an em HTML element.")
+Embed = _make_tag("Embed", "embed", "Represents an embed HTML element.")
+Fencedframe = _make_tag(
+    "Fencedframe", "fencedframe", "Represents a fencedframe HTML element."
+)
+Fieldset = _make_tag("Fieldset", "fieldset", "Represents a fieldset HTML element.")
+Figcaption = _make_tag(
+    "Figcaption", "figcaption", "Represents a figcaption HTML element."
+)
+Figure = _make_tag("Figure", "figure", "Represents a figure HTML element.")
+Font = _make_tag("Font", "font", "Represents a font HTML element.")
+Footer = _make_tag("Footer", "footer", "Represents a footer HTML element.")
+Form = _make_tag("Form", "form", "Represents a form HTML element.")
+Frame = _make_tag("Frame", "frame", "Represents a frame HTML element.")
+Frameset = _make_tag("Frameset", "frameset", "Represents a frameset HTML element.")
+H1 = _make_tag("H1", "h1", "Represents an h1 HTML element.")
+H2 = _make_tag("H2", "h2", "Represents an h2 HTML element.")
+H3 = _make_tag("H3", "h3", "Represents an h3 HTML element.")
+H4 = _make_tag("H4", "h4", "Represents an h4 HTML element.")
+H5 = _make_tag("H5", "h5", "Represents an h5 HTML element.")
+H6 = _make_tag("H6", "h6", "Represents an h6 HTML element.")
+Head = _make_tag("Head", "head", "Represents a head HTML element.")
+Header = _make_tag("Header", "header", "Represents a header HTML element.")
+Hgroup = _make_tag("Hgroup", "hgroup", "Represents a hgroup HTML element.")
+Hr = _make_tag("Hr", "hr", "Represents an hr HTML element.", self_closing=True)
+Html = _make_tag("Html", "html", "Represents an html HTML element.")
+I = _make_tag("I", "i", "Represents an i HTML element.")  # noqa: E741
+Iframe = _make_tag("Iframe", "iframe", "Represents an iframe HTML element.")
+Img = _make_tag("Img", "img", "Represents an img HTML element.", self_closing=True)
+Input = _make_tag(
+    "Input", "input", "Represents an input HTML element.", self_closing=True
+)
+Ins = _make_tag("Ins", "ins", "Represents an ins HTML element.")
+Kbd = _make_tag("Kbd", "kbd", "Represents a kbd HTML element.")
+Label = _make_tag("Label", "label", "Represents a label HTML element.")
+Legend = _make_tag("Legend", "legend", "Represents a legend HTML element.")
+Li = _make_tag("Li", "li", "Represents a li HTML element.")
+Link = _make_tag("Link", "link", "Represents a link HTML element.", self_closing=True)
+Main = _make_tag("Main", "main", "Represents a main HTML element.")
+Map = _make_tag("Map", "map", "Represents a map HTML element.")
+Mark = _make_tag("Mark", "mark", "Represents a mark HTML element.")
+Marquee = _make_tag("Marquee", "marquee", "Represents a marquee HTML element.")
+Menu = _make_tag("Menu", "menu", "Represents a menu HTML element.")
+Meta = _make_tag("Meta", "meta", "Represents a meta HTML element.", self_closing=True)
+Meter = _make_tag("Meter", "meter", "Represents a meter HTML element.")
+Nav = _make_tag("Nav", "nav", "Represents a nav HTML element.")
+Nobr = _make_tag("Nobr", "nobr", "Represents a nobr HTML element.")
+Noembed = _make_tag("Noembed", "noembed", "Represents a noembed HTML element.")
+Noframes = _make_tag("Noframes", "noframes", "Represents a noframes HTML element.")
+Noscript = _make_tag("Noscript", "noscript", "Represents a noscript HTML element.")
+Object = _make_tag("Object", "object", "Represents an object HTML element.")
+Ol = _make_tag("Ol", "ol", "Represents an ol HTML element.")
+Optgroup = _make_tag("Optgroup", "optgroup", "Represents an optgroup HTML element.")
+Option = _make_tag("Option", "option", "Represents an option HTML element.")
+Output = _make_tag("Output", "output", "Represents an output HTML element.")
+P = _make_tag("P", "p", "Represents a p HTML element.")
+Param = _make_tag(
+    "Param", "param", "Represents a param HTML element.", self_closing=True
+)
+Picture = _make_tag("Picture", "picture", "Represents a picture HTML element.")
+Plaintext = _make_tag("Plaintext", "plaintext", "Represents a plaintext HTML element.")
+Portal = _make_tag("Portal", "portal", "Represents a portal HTML element.")
+Pre = _make_tag("Pre", "pre", "Represents a pre HTML element.")
+Progress = _make_tag("Progress", "progress", "Represents a progress HTML element.")
+Q = _make_tag("Q", "q", "Represents a q HTML element.")
+Rb = _make_tag("Rb", "rb", "Represents a rb HTML element.")
+Rp = _make_tag("Rp", "rp", "Represents a rp HTML element.")
+Rt = _make_tag("Rt", "rt", "Represents a rt HTML element.")
+Rtc = _make_tag("Rtc", "rtc", "Represents a rtc HTML element.")
+Ruby = _make_tag("Ruby", "ruby", "Represents a ruby HTML element.")
+S = _make_tag("S", "s", "Represents an s HTML element.")
+Samp = _make_tag("Samp", "samp", "Represents a samp HTML element.")
+Script = _make_tag("Script", "script", "Represents a script HTML element.")
+Search = _make_tag("Search", "search", "Represents a search HTML element.")
+Section = _make_tag("Section", "section", "Represents a section HTML element.")
+Select = _make_tag("Select", "select", "Represents a select HTML element.")
+Slot = _make_tag("Slot", "slot", "Represents a slot HTML element.")
+Small = _make_tag("Small", "small", "Represents a small HTML element.")
+Source = _make_tag(
+    "Source", "source", "Represents a source HTML element.", self_closing=True
+)
+Span = _make_tag("Span", "span", "Represents a span HTML element.")
+Strike = _make_tag("Strike", "strike", "Represents a strike HTML element.")
+Strong = _make_tag("Strong", "strong", "Represents a strong HTML element.")
+Style = _make_tag("Style", "style", "Represents a style HTML element.")
+Sub = _make_tag("Sub", "sub", "Represents a sub HTML element.")
+Summary = _make_tag("Summary", "summary", "Represents a summary HTML element.")
+Sup = _make_tag("Sup", "sup", "Represents a sup HTML element.")
+Svg = _make_tag("Svg", "svg", "Represents an svg HTML element.")
+Table = _make_tag("Table", "table", "Represents a table HTML element.")
+Tbody = _make_tag("Tbody", "tbody", "Represents a tbody HTML element.")
+Td = _make_tag("Td", "td", "Represents a td HTML element.")
+Template = _make_tag("Template", "template", "Represents a template HTML element.")
+Textarea = _make_tag("Textarea", "textarea", "Represents a textarea HTML element.")
+Tfoot = _make_tag("Tfoot", "tfoot", "Represents a tfoot HTML element.")
+Th = _make_tag("Th", "th", "Represents a th HTML element.")
+Thead = _make_tag("Thead", "thead", "Represents a thead HTML element.")
+Time = _make_tag("Time", "time", "Represents a time HTML element.")
+Title = _make_tag("Title", "title", "Represents a title HTML element.")
+Tr = _make_tag("Tr", "tr", "Represents a tr HTML element.")
+Track = _make_tag(
+    "Track", "track", "Represents a track HTML element.", self_closing=True
+)
+Tt = _make_tag("Tt", "tt", "Represents a tt HTML element.")
+U = _make_tag("U", "u", "Represents a u HTML element.")
+Ul = _make_tag("Ul", "ul", "Represents an ul HTML element.")
+Var = _make_tag("Var", "var", "Represents a var HTML element.")
+Video = _make_tag("Video", "video", "Represents a video HTML element.")
+Wbr = _make_tag("Wbr", "wbr", "Represents a wbr HTML element.", self_closing=True)
+Xmp = _make_tag("Xmp", "xmp", "Represents an xmp HTML element.")
@@ -3,11 +3,72 @@ This class represents a complete HTML page structure. It automatically structure
 elements based on the provided root element.
 """
 
-from typing import Literal, Optional, Union, List
+from typing import Callable, Dict, Literal, Optional, Union, List
 from .element import Element, Html, Head, Body, Title, Meta, Link
 
 __all__ = ["Page"]
 
+# Meta tags whose name starts with one of these use the `property` attribute.
+_PROPERTY_PREFIXES = ("og:", "twitter:")
+
+# The meta tags set by Page.dispatch_info for each of its arguments, in order.
+_DISPATCH_META_NAMES = (
+    ("og:title", "twitter:title"),  # title
+    ("description", "og:description", "twitter:description"),  # description
+    ("og:url",),  # url
+    ("og:image", "twitter:image"),  # image
+    ("og:site_name",),  # site_name
+    ("twitter:card",),  # twitter_card
+)
+
+
+def _is_meta_named(element: Union[Element, str], name: str) -> bool:
+    """
+    Returns whether an element is a meta tag with the given name or property.
+    """
+    if not isinstance(element, Meta):
+        return False
+    attributes = element._attributes
+    return attributes.get("name") == name or attributes.get("property") == name
+
+
+def _wrap_head_element(element: Union[Title, Meta, Link]) -> Html:
+    return Html(Head(element), Body())
+
+
+def _wrap_body_content(element: Union[Element, str]) -> Html:
+    return Html(Head(), Body(element))
+
+
+# How a page root is built from the element given to Page, by element type.
+_ROOT_WRAPPERS: Dict[type, Callable[..., Html]] = {
+    Html: lambda element: element,
+    Body: lambda element: Html(Head(), element),
+    Title: _wrap_head_element,
+    Meta: _wrap_head_element,
+    Link: _wrap_head_element,
+}
+
+
+def _wrap_root(root_element: Union[Element, str]) -> Html:
+    """
+    Builds the root Html element of a page from the element given to Page.
+
+    :param root_element: The root element for the page.
+    :type root_element: Union[Element, str]
+    :return: The root Html element.
+    """
+    wrap = _ROOT_WRAPPERS.get(type(root_element))
+    if wrap is None:
+        # Subclasses of the known elements fall back to an MRO walk.
+        for base in type(root_element).__mro__[1:]:
+            if base in _ROOT_WRAPPERS:
+                wrap = _ROOT_WRAPPERS[base]
+                break
+        else:
+            wrap = _wrap_body_content
+    return wrap(root_element)
+
 
 class Page:
     """
@@ -19,33 +80,95 @@ class Page:
     """
 
     def __init__(self, root_element: Union[Element, str]):
-        if isinstance(root_element, Html):
-            self.root = root_element
-        elif isinstance(root_element, Body):
-            self.root = Html(Head(), root_element)
-        elif isinstance(root_element, (Title, Meta, Link)):
-            head = Head(root_element)
-            self.root = Html(head, Body())
-        else:
-            self.root = Html(Head(), Body(root_element))
+        self.root = _wrap_root(root_element)
 
-        self.head = next(
-            (child for child in self.root.children if isinstance(child, Head)), None
-        )
-        self.body = next(
-            (child for child in self.root.children if isinstance(child, Body)), None
-        )
-
-    def add_to_head(self, element: Union[Title, Meta, Link]) -> None:
-        if not self.head:
+        self.head: Optional[Head] = None
+        self.body: Optional[Body] = None
+        for child in self.root.children:
+            if self.head is None and isinstance(child, Head):
+                self.head = child
+            elif self.body is None and isinstance(child, Body):
+                self.body = child
+        # Make sure head and body always exist so that adding to them never has
+        # to insert into the root.
+        if self.head is None:
             self.head = Head()
             self.root.children.insert(0, self.head)
+        if self.body is None:
+            self.body = Body()
+            self.root.children.append(self.body)
+
+        # Head elements indexed by type, and meta tags by their name/property, so
+        # that dispatch_info does not rescan the head. Filled in by add_to_head and
+        # by the scans on a miss; hits are checked as the head may be modified
+        # directly.
+        self._head_index: Dict[type, Element] = {}
+        self._meta_index: Dict[str, Meta] = {}
+        for child in self.head.children:
+            self._index_head_element(child)
+
+    def add_to_head(self, element: Union[Title, Meta, Link]) -> None:
         self.head.children.append(element)
+        self._index_head_element(element)
+
+    def _index_head_element(self, element: Union[Element, str]) -> None:
+        if not isinstance(element, Element):
+            return
+        self._head_index.setdefault(type(element), element)
+        if isinstance(element, Meta):
+            for key in ("name", "property"):
+                value = element.attributes.get(key)
+                if value is not None:
+                    self._meta_index.setdefault(value, element)
+
+    def _in_head(self, element: Element) -> bool:
+        head = self.head
+        return element.parent is head or element in head.children
+
+    def _find_head_element(self, element_type: type) -> Optional[Element]:
+        """
+        Returns the first element of the given type in the head section.
+
+        :param element_type: The type of element to look for.
+        :type element_type: type
+        :return: The element, or None if there is none.
+        """
+        element = self._head_index.get(element_type)
+        if element is not None and self._in_head(element):
+            return element
+        element = next(
+            (child for child in self.head.children if isinstance(child, element_type)),
+            None,
+        )
+        if element is None:
+            self._head_index.pop(element_type, None)
+        else:
+            self._head_index[element_type] = element
+        return element
+
+    def _find_meta(self, name: str) -> Optional[Meta]:
+        """
+        Returns the first meta tag of the head section with the given name or
+        property attribute.
+
+        :param name: The meta tag name or property attribute.
+        :type name: str
+        :return: The meta tag, or None if there is none.
+        """
+        meta = self._meta_index.get(name)
+        if meta is not None and _is_meta_named(meta, name) and self._in_head(meta):
+            return meta
+        meta = next(
+            (child for child in self.head.children if _is_meta_named(child, name)),
+            None,
+        )
+        if meta is None:
+            self._meta_index.pop(name, None)
+        else:
+            self._meta_index[name] = meta
+        return meta
 
     def add_to_body(self, element: Union[Element, str]) -> None:
-        if not self.body:
-            self.body = Body()
-            self.root.children.append(self.body)
         self.body.children.append(element)
 
     def query_selector(self, selector: str) -> Optional[Element]:
@@ -94,15 +217,8 @@ class Page:
         """
         return self.root.child_elements
 
-    # Property to get the parent (None for Page)
-    @property
-    def parent(self) -> None:
-        """
-        Returns None as the page does not have a parent element.
-
-        :return: None
-        """
-        return None
+    #: Always None, as the page does not have a parent element.
+    parent: None = None
 
     def dispatch_info(
         self,
@@ -133,21 +249,11 @@ class Page:
         """
         if title:
             self._set_or_update_element(Title(title), element_type=Title)
-            self._set_or_update_meta("og:title", title)
-            self._set_or_update_meta("twitter:title", title)
-        if description:
-            self._set_or_update_meta("description", description)
-            self._set_or_update_meta("og:description", description)
-            self._set_or_update_meta("twitter:description", description)
-        if url:
-            self._set_or_update_meta("og:url", url)
-        if image:
-            self._set_or_update_meta("og:image", image)
-            self._set_or_update_meta("twitter:image", image)
-        if site_name:
-            self._set_or_update_meta("og:site_name", site_name)
-        if twitter_card:
-            self._set_or_update_meta("twitter:card", twitter_card)
+        values = (title, description, url, image, site_name, twitter_card)
+        for value, names in zip(values, _DISPATCH_META_NAMES):
+            if value:
+                for name in names:
+                    self._set_or_update_meta(name, value)
 
     def _set_or_update_element(
         self, element: Union[Title, Meta, Link], element_type: Optional[type] = None
@@ -160,14 +266,7 @@ class Page:
         :param element_type: Optional specific type of element to look for.
         :type element_type: Optional[type]
         """
-        existing_element = next(
-            (
-                child
-                for child in self.head.children
-                if isinstance(child, element_type or type(element))
-            ),
-            None,
-        )
+        existing_element = self._find_head_element(element_type or type(element))
         if existing_element:
             existing_element.children = element.children  # Update content
         else:
@@ -182,34 +281,15 @@ class Page:
         :param content: The content for the meta tag.
         :type content: str
         """
-        existing_meta = next(
-            (
-                child
-                for child in self.head.children
-                if isinstance(child, Meta)
-                and child.attributes.get("name") == name  # noqa
-                or child.attributes.get("property") == name  # noqa
-            ),
-            None,
-        )
+        existing_meta = self._find_meta(name)
         if existing_meta:
             existing_meta.attributes["content"] = (
                 content  # Update content if meta tag exists
             )
         else:
             # Add new meta tag if not exists
-            self.add_to_head(
-                Meta(
-                    attributes={
-                        (
-                            "name"
-                            if "og:" not in name and "twitter:" not in name
-                            else "property"
-                        ): name,
-                        "content": content,
-                    }
-                )
-            )
+            key = "property" if name.startswith(_PROPERTY_PREFIXES) else "name"
+            self.add_to_head(Meta(attributes={key: name, "content": content}))
 
     def render(self) -> str:
         return self.root.render()
@@ -3,13 +3,13 @@ Utility functions for the haru.ui module.
 """
 
 import re
-from typing import Dict, Literal, Optional, Union, List
+from functools import lru_cache
+from typing import Dict, Iterable, Literal, Optional, Tuple, Type, Union, List
 from .element import (
     Element,
     Div,
     Input,
     Label,
-    Pre,
     Code,
     Ul,
     Ol,
@@ -27,16 +27,135 @@ from .element import (
     Table,
     Tr,
     Td,
+    _escape,
 )
 
 __all__ = ["VStack", "HStack", "Markdown", "DataTable", "FormField", "FormGenerator"]
 
+# Markdown patterns, compiled once at import time.
+_RE_HR = re.compile(r"^(\* \* \*|\- \- \-|---|\*{3,})$")
+# The delimiter row under a table header, e.g. '| :-- | --: |'.
+_RE_TABLE_DELIMITER = re.compile(r"^\|(\s*:?-+:?\s*\|)+$")
+_RE_IMAGE_LINE = re.compile(r"^!\[.*\]\(.*\)$")
+_RE_LINK_LINE = re.compile(r"^\[.*\]\(.*\)$")
+_RE_IMG = re.compile(r"!\[(.*?)\]\((.*?)\)")
+_RE_LINK = re.compile(r"\[(.*?)\]\((.*?)\)")
+# Table cell alignment indexed by (starts with ':') << 1 | (ends with ':').
+_TABLE_ALIGNMENTS = ("left", "right", "left", "center")
+
+# Heading elements by level, starting at level 1.
+_HEADINGS = (H1, H2, H3, H4, H5, H6)
+
+# First characters of lines that can start a Markdown block.
+_BLOCK_START_CHARS = frozenset("#>*-|`![0123456789")
+
+
+def _is_ol_line(line: str) -> bool:
+    """
+    Returns whether the line is an ordered list item (digits followed by '. ').
+    """
+    index = 0
+    length = len(line)
+    while index < length and line[index].isdecimal():
+        index += 1
+    return index > 0 and line.startswith(". ", index)
+
+
+def _format_inline(text: str) -> str:
+    """
+    Applies bold, italic, strikethrough and inline code formatting in one scan to
+    HTML-escaped text.
+    Delimiters are located with str.find; at each position the leftmost opening
+    delimiter with a closing one wins, trying bold before italic. Bold, italic
+    and strikethrough contents are formatted recursively.
+    """
+    if "*" not in text and "~~" not in text and "`" not in text:
+        return text
+    out = []
+    append = out.append
+    length = len(text)
+    # Next position of each opening delimiter, refreshed once passed.
+    found = {"*": text.find("*"), "~~": text.find("~~"), "`": text.find("`")}
+    start = index = 0
+    while True:
+        nearest = length
+        for marker, position in found.items():
+            if 0 <= position < index:
+                position = found[marker] = text.find(marker, index)
+            if 0 <= position < nearest:
+                nearest = position
+        if nearest >= length:
+            break
+        index = nearest
+        char = text[index]
+        if char == "`":
+            close = text.find("`", index + 2)
+            if close >= 0:
+                append(text[start:index])
+                append(f"<pre>{text[index + 1:close]}</pre>")
+                index = start = close + 1
+                continue
+        elif char == "~":
+            close = text.find("~~", index + 3)
+            if close >= 0:
+                append(text[start:index])
+                append(f"<del>{_format_inline(text[index + 2:close])}</del>")
+                index = start = close + 2
+                continue
+        else:
+            if text.startswith("**", index):
+                close = text.find("**", index + 3)
+                if close >= 0:
+                    append(text[start:index])
+                    append(f"<b>{_format_inline(text[index + 2:close])}</b>")
+                    index = start = close + 2
+                    continue
+            close = text.find("*", index + 2)
+            if close >= 0:
+                append(text[start:index])
+                append(f"<i>{_format_inline(text[index + 1:close])}</i>")
+                index = start = close + 1
+                continue
+        index += 1
+    if not start:
+        return text
+    append(text[start:])
+    return "".join(out)
+
+
+class _LineReader:
+    """
+    An iterator over lines that can push back the line a block parser read past
+    the end of its block, so that the next parser starts from it.
+    """
+
+    __slots__ = ("_lines", "_pushed")
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._lines = iter(lines)
+        self._pushed: Optional[str] = None
+
+    def __iter__(self) -> "_LineReader":
+        return self
+
+    def __next__(self) -> str:
+        line = self._pushed
+        if line is None:
+            return next(self._lines)
+        self._pushed = None
+        return line
+
+    def push(self, line: str) -> None:
+        self._pushed = line
+
 
 class VStack(Element):
     """
     A vertical stack of elements.
     """
 
+    __slots__ = ()
+
     def __init__(self, *elements: Element) -> None:
         super().__init__(
             "div",
@@ -53,6 +172,8 @@ class HStack(Element):
     A horizontal stack of elements.
     """
 
+    __slots__ = ()
+
     def __init__(self, *elements: Element) -> None:
         super().__init__(
             "div",
@@ -69,111 +190,153 @@ class Markdown(Element):
     A class to parse and render markdown text into HTML elements.
     """
 
+    __slots__ = ()
+
     def __init__(self, markdown_text: str) -> None:
         super().__init__("div", attributes={"class": "markdown"})
-        self.children = self._parse_markdown(markdown_text)
+        self.children = [
+            child._clone() if isinstance(child, Element) else child
+            for child in _parse_markdown_cached(type(self), markdown_text)
+        ]
 
-    def _parse_markdown(self, text: str) -> List[Union[str, Element]]:
-        lines = text.splitlines()
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clears the cache of parsed markdown documents.
+        """
+        _parse_markdown_cached.cache_clear()
+
+    @classmethod
+    def from_file(cls, path: str, encoding: str = "utf-8") -> "Markdown":
+        """
+        Creates a Markdown element from a file, parsing it line by line as it is
+        read instead of loading the whole document first.
+
+        :param path: The path of the markdown file.
+        :type path: str
+        :param encoding: The encoding of the file (default is 'utf-8').
+        :type encoding: str
+        :return: The Markdown element.
+        """
+        self = cls.__new__(cls)
+        Element.__init__(self, "div", attributes={"class": "markdown"})
+        with open(path, encoding=encoding) as file:
+            self.children = cls._parse_markdown(file)
+        return self
+
+    @classmethod
+    def _parse_markdown(cls, lines: Iterable[str]) -> List[Union[str, Element]]:
         elements = []
-        buffer = []
+        # Lines of the paragraph being collected, joined once when it ends.
+        buffer: List[str] = []
+        add_line = buffer.append
 
-        for line in lines:
+        def flush() -> None:
+            elements.extend(cls._parse_paragraph(" ".join(buffer)))
+            buffer.clear()
+
+        reader = _LineReader(lines)
+        for line in reader:
             line = line.rstrip()
 
-            if line.startswith("#"):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(self._parse_heading(line))
-            elif re.match(r"^(\* \* \*|\- \- \-|---|\*{3,})$", line):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(Hr())
-            elif line.startswith(">"):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(self._parse_blockquote(line))
-            elif re.match(r"^\* |\d+\. ", line):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(self._parse_list(lines))
-            elif re.match(r"^\|", line):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(self._parse_table(lines))
-            elif line.startswith("```"):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(self._parse_code_block(lines))
-            elif re.match(
-                r"^!$begin:math:display$.*$end:math:display$$begin:math:text$.*$end:math:text$$",
-                line,
-            ) or re.match(
-                r"^$begin:math:display$.*$end:math:display$$begin:math:text$.*$end:math:text$$",
-                line,
+            # Most lines are prose; only lines starting with one of these
+            # characters can begin a block, so the rest skip every pattern.
+            first = line[:1]
+            if first not in _BLOCK_START_CHARS:
+                if line:
+                    add_line(line)
+                elif buffer:
+                    flush()
+                continue
+
+            if first == "#":
+                block = cls._parse_heading(line)
+            elif first in "*-" and _RE_HR.match(line):
+                block = Hr()
+            elif first == ">":
+                block = cls._parse_blockquote(line)
+            elif line.startswith("* ") or _is_ol_line(line):
+                block = cls._parse_list(line, reader)
+            elif first == "|":
+                block = cls._parse_table(line, reader)
+                if block is None:
+                    add_line(line)
+                    continue
+            elif first == "`" and line.startswith("```"):
+                block = cls._parse_code_block(line, reader)
+            elif (first == "!" and _RE_IMAGE_LINE.match(line)) or (
+                first == "[" and _RE_LINK_LINE.match(line)
             ):
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
-                elements.append(self._parse_link_or_image(line))
-            elif line:
-                buffer.append(line)
+                block = cls._parse_link_or_image(line)
             else:
-                if buffer:
-                    elements.extend(self._parse_paragraph(" ".join(buffer)))
-                    buffer = []
+                add_line(line)
+                continue
+
+            if buffer:
+                flush()
+            elements.append(block)
         if buffer:
-            elements.extend(self._parse_paragraph(" ".join(buffer)))
+            flush()
 
         return elements
 
-    def _parse_heading(self, line: str) -> Element:
+    @classmethod
+    def _parse_heading(cls, line: str) -> Element:
         level = len(line) - len(line.lstrip("#"))
         content = line[level:].strip()
-        heading_map = {1: H1, 2: H2, 3: H3, 4: H4, 5: H5, 6: H6}
-        return heading_map.get(level, H1)(content)
+        return (_HEADINGS[level - 1] if level <= len(_HEADINGS) else H1)(content)
 
-    def _parse_blockquote(self, line: str) -> Element:
+    @classmethod
+    def _parse_blockquote(cls, line: str) -> Element:
         content = line.lstrip("> ").strip()
         return Blockquote(content)
 
-    def _parse_list(self, lines: List[str]) -> Element:
+    @classmethod
+    def _parse_list(cls, first: str, reader: "_LineReader") -> Element:
+        ordered = _is_ol_line(first)
         elements = []
-        for line in lines:
-            if re.match(r"^\d+\. ", line):
+        line = first
+        while True:
+            if ordered and _is_ol_line(line):
                 elements.append(Li(line.lstrip("0123456789. ")))
-                list_type = Ol
-            elif line.startswith("* "):
+            elif not ordered and line.startswith("* "):
                 elements.append(Li(line.lstrip("* ")))
-                list_type = Ul
             else:
+                reader.push(line)
                 break
-        return list_type(*elements)
-
-    def _parse_table(self, lines: List[str]) -> Element:
-        header, alignments, *rows = lines
+            line = next(reader, None)
+            if line is None:
+                break
+            line = line.rstrip()
+        return (Ol if ordered else Ul)(*elements)
+
+    @classmethod
+    def _parse_table(cls, first: str, reader: "_LineReader") -> Optional[Element]:
+        # Without a delimiter row on the next line, the block is not a table.
+        delimiter = next(reader, None)
+        if delimiter is None:
+            return None
+        delimiter = delimiter.rstrip()
+        if not _RE_TABLE_DELIMITER.match(delimiter):
+            reader.push(delimiter)
+            return None
+        table_lines = [first, delimiter]
+        for line in reader:
+            if not line.startswith("|"):
+                reader.push(line)
+                break
+            table_lines.append(line.rstrip())
+        header, alignments, *rows = table_lines
         align = []
         for align_indicator in alignments.split("|")[1:-1]:
+            align_indicator = align_indicator.strip()
             align.append(
-                "left"
-                if align_indicator.startswith(":") and align_indicator.endswith("-")
-                else (
-                    "right"
-                    if align_indicator.endswith(":")
-                    else (
-                        "center"
-                        if align_indicator.startswith(":")
-                        and align_indicator.endswith(":")  # noqa
-                        else "left"
-                    )
-                )
+                _TABLE_ALIGNMENTS[
+                    align_indicator.startswith(":") << 1 | align_indicator.endswith(":")
+                ]
             )
+        # Header cells beyond the alignment row default to left alignment.
+        align.extend(["left"] * (header.count("|") - len(align)))
         table_elements = [
             Tr(
                 *[
@@ -188,36 +351,55 @@ class Markdown(Element):
             )
         return Table(*table_elements)
 
-    def _parse_code_block(self, lines: List[str]) -> Element:
-        language = lines[0][3:].strip() if len(lines[0]) > 3 else None
+    @classmethod
+    def _parse_code_block(cls, first: str, reader: "_LineReader") -> Element:
+        language = first[3:].strip() if len(first) > 3 else None
         code_lines = []
-        for line in lines[1:]:
+        # Reads up to and including the closing fence.
+        for line in reader:
             if line.startswith("```"):
                 break
-            code_lines.append(line)
+            code_lines.append(line.rstrip("\r\n"))
         return Code(
             "\n".join(code_lines),
             attributes={"class": f"language-{language}"} if language else None,
         )
 
-    def _parse_link_or_image(self, line: str) -> Element:
+    @classmethod
+    def _parse_link_or_image(cls, line: str) -> Element:
         if line.startswith("!"):
-            alt_text, src = re.findall(r"!\[(.*?)\]\((.*?)\)", line)[0]
+            alt_text, src = _RE_IMG.findall(line)[0]
             return Img(attributes={"alt": alt_text, "src": src})
         else:
-            text, href = re.findall(r"\[(.*?)\]\((.*?)\)", line)[0]
+            text, href = _RE_LINK.findall(line)[0]
             return A(text, attributes={"href": href})
 
-    def _parse_paragraph(self, text: str) -> List[Union[str, Element]]:
-        text = self._apply_inline_formatting(text)
-        return [Div(text)]
+    @classmethod
+    def _parse_paragraph(cls, text: str) -> List[Union[str, Element]]:
+        paragraph = Div(cls._apply_inline_formatting(text))
+        # The text is escaped before the formatting tags are inserted.
+        paragraph.raw = True
+        return [paragraph]
 
-    def _apply_inline_formatting(self, text: str) -> str:
-        text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)  # Bold
-        text = re.sub(r"\*(.+?)\*", r"<i>\1</i>", text)  # Italic
-        text = re.sub(r"~~(.+?)~~", r"<del>\1</del>", text)  # Strikethrough
-        text = re.sub(r"`(.+?)`", lambda m: str(Pre(m.group(1))), text)  # Inline code
-        return text
+    @classmethod
+    def _apply_inline_formatting(cls, text: str) -> str:
+        return _format_inline(_escape(text))
+
+
+@lru_cache(maxsize=256)
+def _parse_markdown_cached(
+    cls: Type[Markdown], text: str
+) -> Tuple[Union[str, Element], ...]:
+    """
+    Parses a markdown document once per distinct text and Markdown class, as
+    subclasses may override the parsing methods. The returned elements are
+    pre-rendered templates that Markdown clones, so their cached HTML is reused.
+    """
+    children = tuple(cls._parse_markdown(text.splitlines()))
+    for child in children:
+        if isinstance(child, Element):
+            child.freeze()
+    return children
 
 
 class DataTable(Element):
@@ -225,9 +407,12 @@ class DataTable(Element):
     A class to render a table of data.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: List[List[Union[str, int]]]) -> None:
         super().__init__("table")
-        self.children = [Tr(*[Td(cell) for cell in row]) for row in data]
+        tr, td = Tr, Td
+        self.children = [tr(*map(td, row)) for row in data]
 
 
 class FormField(Element):
@@ -235,6 +420,8 @@ class FormField(Element):
     A class to represent a field in a form.
     """
 
+    __slots__ = ()
+
     input_types = Literal[
         "button",
         "checkbox",
@@ -278,6 +465,8 @@ class FormGenerator(Element):
     A class to generate a form from a dictionary of fields.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, fields: Dict[str, FormField], action: Optional[str] = None
     ) -> None:
@@ -5,15 +5,24 @@ import functools
 import logging
 import ssl
 import threading
-from typing import Any, Awaitable, Callable, Dict, Optional, Set, Union
+import time
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar, Union
 from . import exceptions
 from . import utils
 
 from .exceptions import ConnectionClosed, SecurityError
 from .protocol import State, WebSocketProtocol
+from .server import WebSocketHandler
 from .server import WebSocketServer as BaseWebSocketServer
 from .utils import Deadline
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    uvloop = None
+
 __all__ = [
     "exceptions",
     "utils",
@@ -29,16 +38,35 @@ IDLE_TIMEOUT = 300
 MAX_MESSAGE_SIZE = 1024 * 1024  # 1MB
 RATE_LIMIT_MESSAGES = 100
 RATE_LIMIT_WINDOW = 10  # seconds
+_RATE_LIMIT_REFILL = RATE_LIMIT_MESSAGES / RATE_LIMIT_WINDOW  # tokens per second
+
+T = TypeVar("T")
 
 
 class WebSocketServerProtocol(WebSocketProtocol):
     """
     WebSocket protocol implementation for Haru framework.
 
+    Its coroutines run on the event loop of the server and perform the blocking
+    I/O of the underlying connection in the server's executor. It shares the
+    connection state of that connection.
+
     :param max_size: Maximum message size in bytes
     :param logger: Logger instance
     """
 
+    __slots__ = (
+        "application",
+        "path",
+        "query_string",
+        "path_params",
+        "_headers",
+        "_tokens",
+        "_last_refill",
+        "connection",
+        "executor",
+    )
+
     def __init__(
         self,
         max_size: Optional[int] = None,
@@ -54,10 +82,39 @@ class WebSocketServerProtocol(WebSocketProtocol):
         self.application: Any = None
         self.path: str = ""
         self.query_string: str = ""
-        self.headers: Dict[str, str] = {}
+        self.path_params: Dict[str, str] = {}
+        self._headers: Optional[Dict[str, str]] = None
+        # Set by the server when the connection is accepted
+        self.connection: Optional[WebSocketHandler] = None
+        self.executor: Optional[Executor] = None
+
+        # Token bucket for rate limiting: refills at RATE_LIMIT_MESSAGES per
+        # RATE_LIMIT_WINDOW seconds, holding at most RATE_LIMIT_MESSAGES tokens.
+        self._tokens = float(RATE_LIMIT_MESSAGES)
+        self._last_refill = time.monotonic()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Request headers of the connection."""
+        if self._headers is None:
+            self._headers = {}
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Dict[str, str]) -> None:
+        self._headers = headers
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking method of the connection in the server's executor.
 
-        self._message_count = 0
-        self._message_time = 0.0
+        :param func: Method to run
+        :param args: Its arguments
+        :return: Its result
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, func, *args
+        )
 
     async def send(self, message: Union[str, bytes]) -> None:
         """
@@ -67,19 +124,22 @@ class WebSocketServerProtocol(WebSocketProtocol):
         :raises ConnectionClosed: If connection is closed
         :raises SecurityError: If rate limit is exceeded
         """
-        if self.state != State.OPEN:
+        if self.state.state != State.OPEN:
             raise ConnectionClosed(code=1006, reason="Connection is not open")
 
-        current_time = asyncio.get_event_loop().time()
-        if current_time - self._message_time >= RATE_LIMIT_WINDOW:
-            self._message_count = 0
-            self._message_time = current_time
-
-        self._message_count += 1
-        if self._message_count > RATE_LIMIT_MESSAGES:
+        now = time.monotonic()
+        tokens = self._tokens + (now - self._last_refill) * _RATE_LIMIT_REFILL
+        self._last_refill = now
+        if tokens > RATE_LIMIT_MESSAGES:
+            tokens = RATE_LIMIT_MESSAGES
+        if tokens < 1:
+            self._tokens = tokens
             raise SecurityError("Rate limit exceeded")
+        self._tokens = tokens - 1
 
-        if isinstance(message, str):
+        # A code point is at most 4 bytes in UTF-8, so short strings can be
+        # accepted without encoding them just to measure.
+        if isinstance(message, str) and len(message) * 4 > self.max_size:
             size = len(message.encode("utf-8"))
         else:
             size = len(message)
@@ -87,7 +147,7 @@ class WebSocketServerProtocol(WebSocketProtocol):
         if size > self.max_size:
             raise ValueError(f"Message size exceeds limit: {size} > {self.max_size}")
 
-        await super().send(message)
+        await self._call(self.connection.send, message)
 
     async def receive(self) -> Union[str, bytes]:
         """
@@ -96,10 +156,10 @@ class WebSocketServerProtocol(WebSocketProtocol):
         :return: Received message
         :raises ConnectionClosed: If connection is closed
         """
-        if self.state != State.OPEN:
+        if self.state.state != State.OPEN:
             raise ConnectionClosed(code=1006, reason="Connection is not open")
 
-        return await super().receive()
+        return await self._call(self.connection.recv)
 
     async def close(self, code: int = 1000, reason: str = "") -> None:
         """
@@ -109,16 +169,34 @@ class WebSocketServerProtocol(WebSocketProtocol):
         :param reason: Reason for closure
         """
         try:
-            await super().close(code, reason)
+            await self._call(self.connection.close, code, reason)
         except Exception as exc:
             self.logger.error(f"Error during connection close: {exc}")
             raise
 
 
+class _RouteNode:
+    """
+    A node of the path segment trie holding parameterized WebSocket routes.
+    """
+
+    __slots__ = ("children", "param", "param_name", "handler")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _RouteNode] = {}
+        self.param: Optional[_RouteNode] = None
+        self.param_name: str = ""
+        self.handler: Optional[Callable[[WebSocketServerProtocol], Awaitable[None]]] = None
+
+
 class WebSocketServer(BaseWebSocketServer):
     """
     WebSocket server implementation for Haru framework.
 
+    Connections are accepted and read by the threaded base server. The
+    coroutine handlers of the routes run on an event loop of the server, in a
+    thread of its own, and perform blocking I/O in the server's executor.
+
     :param host: Host to bind to
     :param port: Port to bind to
     :param ssl_context: Optional SSL context
@@ -130,19 +208,41 @@ class WebSocketServer(BaseWebSocketServer):
         port: int,
         ssl_context: Optional[ssl.SSLContext] = None,
     ) -> None:
-        super().__init__(host=host, port=port, ssl_context=ssl_context)
+        super().__init__(
+            self._serve_connection,
+            host=host,
+            port=port,
+            ssl_context=ssl_context,
+            logger=logging.getLogger("haru.websocket"),
+            max_size=MAX_MESSAGE_SIZE,
+        )
 
-        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.loop: asyncio.AbstractEventLoop = (
+            uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        )
         self.thread: Optional[threading.Thread] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        # Each connection waiting for a message holds a worker, so there is one
+        # per possible connection; threads are only created as they are needed.
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONNECTIONS, thread_name_prefix="haru-websocket"
+        )
         self.routes: Dict[str, Callable[[WebSocketServerProtocol], Awaitable[None]]] = (
             {}
         )
 
-        self._active_connections: Set[WebSocketServerProtocol] = set()
-        self._connections_lock = threading.Lock()
-
-        self._running = False
-        self._shutdown_event = threading.Event()
+        self._route_trie = _RouteNode()
+        self._has_param_routes = False
+
+        # Gates the number of concurrent handlers. Never awaited while locked, as
+        # connections beyond capacity are refused rather than queued.
+        self._capacity = asyncio.Semaphore(MAX_CONNECTIONS)
+        # Connections to close on shutdown. Only touched from coroutines running
+        # on self.loop, so it needs no lock. Weak references so a protocol that
+        # escapes its handler is not kept alive.
+        self._active_connections: weakref.WeakSet[WebSocketServerProtocol] = (
+            weakref.WeakSet()
+        )
 
     def add_route(
         self, path: str, handler: Callable[[WebSocketServerProtocol], Awaitable[None]]
@@ -150,10 +250,52 @@ class WebSocketServer(BaseWebSocketServer):
         """
         Register a WebSocket route.
 
-        :param path: URL path
+        :param path: URL path. Segments written as ``<name>`` match any value,
+            which is passed to the handler in ``protocol.path_params``.
         :param handler: Handler function
         """
         self.routes[path] = handler
+        if "<" not in path:
+            return
+
+        node = self._route_trie
+        for segment in path.strip("/").split("/"):
+            if segment.startswith("<") and segment.endswith(">"):
+                if node.param is None:
+                    node.param = _RouteNode()
+                    node.param.param_name = segment[1:-1].split(":", 1)[0]
+                node = node.param
+            else:
+                node = node.children.setdefault(segment, _RouteNode())
+        node.handler = handler
+        self._has_param_routes = True
+
+    def _match_route(
+        self, path: str
+    ) -> Tuple[Optional[Callable[[WebSocketServerProtocol], Awaitable[None]]], Dict[str, str]]:
+        """
+        Find the handler for a request path.
+
+        :param path: Request path
+        :return: The handler, or None if no route matches, and the path parameters
+        """
+        handler = self.routes.get(path)
+        if handler is not None or not self._has_param_routes:
+            return handler, {}
+
+        node = self._route_trie
+        params: Dict[str, str] = {}
+        for segment in path.strip("/").split("/"):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.param
+                if child is None:
+                    return None, {}
+                params[child.param_name] = segment
+            node = child
+        if node.handler is None:
+            return None, {}
+        return node.handler, params
 
     async def _connection_handler(
         self, protocol: WebSocketServerProtocol, path: str
@@ -164,62 +306,101 @@ class WebSocketServer(BaseWebSocketServer):
         :param protocol: WebSocket protocol instance
         :param path: Request path
         """
-        handler = self.routes.get(path)
+        handler, protocol.path_params = self._match_route(path)
         if not handler:
             await protocol.close(1003, f"No handler found for path: {path}")
             return
 
-        with self._connections_lock:
-            if len(self._active_connections) >= MAX_CONNECTIONS:
-                await protocol.close(1013, "Server is at capacity")
-                return
-            self._active_connections.add(protocol)
+        if self._capacity.locked():
+            await protocol.close(1013, "Server is at capacity")
+            return
 
-        try:
-            deadline = Deadline(HANDSHAKE_TIMEOUT)
-            await asyncio.wait_for(handler(protocol), timeout=deadline.remaining())
-        except asyncio.TimeoutError:
-            await protocol.close(1001, "Operation timed out")
-        except Exception as exc:
-            self.logger.error(f"Error in WebSocket handler: {exc}")
-            await protocol.close(1011, "Internal server error")
-        finally:
-            with self._connections_lock:
+        async with self._capacity:
+            self._active_connections.add(protocol)
+            try:
+                deadline = Deadline(HANDSHAKE_TIMEOUT)
+                await asyncio.wait_for(handler(protocol), timeout=deadline.remaining())
+            except asyncio.TimeoutError:
+                await protocol.close(1001, "Operation timed out")
+            except Exception as exc:
+                self.logger.error(f"Error in WebSocket handler: {exc}")
+                await protocol.close(1011, "Internal server error")
+            finally:
                 self._active_connections.discard(protocol)
 
+    def _serve_connection(self, connection: WebSocketHandler) -> None:
+        """
+        Run the route handler of an accepted connection on the event loop, from
+        the thread of the connection, and wait for it to finish.
+
+        :param connection: The connection, after its opening handshake
+        """
+        request = connection.request
+        path, _, query_string = request.target.partition("?")
+
+        protocol = WebSocketServerProtocol(max_size=self.max_size, logger=self.logger)
+        protocol.connection = connection
+        protocol.executor = self._executor
+        protocol.state = connection.protocol.state
+        protocol.path = path
+        protocol.query_string = query_string
+        protocol.headers = {
+            name.lower(): ", ".join(request.headers.get_all(name))
+            for name in request.headers
+        }
+
+        asyncio.run_coroutine_threadsafe(
+            self._connection_handler(protocol, path), self.loop
+        ).result()
+
+    async def _close_connections(self) -> None:
+        """Close all active connections from the event loop thread."""
+        for protocol in list(self._active_connections):
+            try:
+                await protocol.close(1001, "Server shutting down")
+            except Exception:
+                pass
+
     def start(self) -> None:
-        """Start the WebSocket server."""
-        if self._running:
+        """Start the WebSocket server in background threads."""
+        if self.thread is not None:
             return
 
-        self._running = True
-        self.thread = threading.Thread(target=self._run_server, daemon=True)
+        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._loop_thread.start()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
         self.thread.start()
 
+    def _run_loop(self) -> None:
+        """Run the server's event loop in its thread until shutdown."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
     def shutdown(self) -> None:
         """Shutdown the WebSocket server."""
-        if not self._running:
+        thread, self.thread = self.thread, None
+        if thread is None:
             return
 
-        self._running = False
-        self._shutdown_event.set()
-
-        for protocol in list(self._active_connections):
+        if self.loop.is_running():
             try:
                 asyncio.run_coroutine_threadsafe(
-                    protocol.close(1001, "Server shutting down"), self.loop
-                )
+                    self._close_connections(), self.loop
+                ).result(timeout=10.0)
             except Exception:
                 pass
 
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=5.0)
+        # Stops accepting connections and closes the remaining ones
+        super().shutdown()
 
-        try:
-            self.loop.call_soon_threadsafe(self.loop.stop)
-            self.loop.close()
-        except Exception:
-            pass
+        # serve_forever calls shutdown from the server thread when it ends
+        if thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join(timeout=5.0)
+        self.loop.close()
+        self._executor.shutdown(wait=False)
 
 
 def upgrade_websocket(
@@ -245,7 +426,7 @@ def upgrade_websocket(
             except Exception:
                 pass
         finally:
-            if websocket.state != State.CLOSED:
+            if websocket.state.state != State.CLOSED:
                 await websocket.close(1000, "Handler completed")
 
     wrapper.is_websocket = True  # type: ignore
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque
+
+__all__ = ["BufferPool"]
+
+
+class BufferPool:
+    """
+    A bounded LIFO pool of reusable bytearrays for serializing frames.
+
+    The most recently released buffer is handed out first, so it is likely still
+    in cache. :meth:`collections.deque.append` and :meth:`collections.deque.pop`
+    are atomic, so a pool can be shared by the threads of one connection.
+
+    :param max_buffers: Maximum number of idle buffers kept
+    :param max_buffer_size: Buffers larger than this are not kept, so a single
+        large message does not pin its memory for the lifetime of the pool
+    """
+
+    __slots__ = ("_buffers", "_max_buffer_size")
+
+    def __init__(self, max_buffers: int = 16, max_buffer_size: int = 64 * 1024) -> None:
+        self._buffers: Deque[bytearray] = deque(maxlen=max_buffers)
+        self._max_buffer_size = max_buffer_size
+
+    def acquire(self, min_size: int = 0) -> bytearray:
+        """
+        Get a buffer from the pool, or a new one if the pool is empty.
+
+        :param min_size: Size of a newly allocated buffer. Pooled buffers may be
+            shorter or longer; writers resize them as needed
+        :return: A buffer owned by the caller until it is released
+        """
+        try:
+            return self._buffers.pop()
+        except IndexError:
+            return bytearray(min_size)
+
+    def release(self, buffer: bytearray) -> None:
+        """
+        Return a buffer to the pool. The caller must not use it afterwards.
+
+        :param buffer: Buffer obtained from :meth:`acquire`
+        """
+        if len(buffer) <= self._max_buffer_size:
+            self._buffers.append(buffer)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import enum
 import struct
-from typing import NamedTuple, Optional, Tuple, Union
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from .exceptions import FrameError, PayloadError
 from .utils import BytesLike, apply_mask
@@ -12,6 +12,7 @@ __all__ = [
     "Opcode",
     "FrameHeader",
     "parse_frame",
+    "parse_frames",
     "create_frame",
 ]
 
@@ -37,6 +38,15 @@ CONTROL_FRAMES = {Opcode.CLOSE, Opcode.PING, Opcode.PONG}
 DATA_FRAMES = {Opcode.CONTINUATION, Opcode.TEXT, Opcode.BINARY}
 
 
+# Packers for the frame header without and with the extended payload length
+_pack_header = struct.Struct("!BB").pack
+_pack_header_16 = struct.Struct("!BBH").pack
+_pack_header_64 = struct.Struct("!BBQ").pack
+# Readers of the extended payload length at an offset, without slicing the data
+_unpack_length_16 = struct.Struct("!H").unpack_from
+_unpack_length_64 = struct.Struct("!Q").unpack_from
+
+
 class CloseCode(enum.IntEnum):
     """
     WebSocket close codes as defined in RFC 6455.
@@ -112,15 +122,45 @@ class Frame:
         self.rsv3 = rsv3
         self._validate()
 
+    @classmethod
+    def _from_raw(
+        cls,
+        fin: bool,
+        opcode: Opcode,
+        payload: bytes,
+        rsv1: bool = False,
+        rsv2: bool = False,
+        rsv3: bool = False,
+    ) -> Frame:
+        """
+        Create a frame from a payload the caller owns, without copying it.
+
+        :param fin: Whether this is the final frame in a message
+        :param opcode: Frame opcode, already converted to :class:`Opcode`
+        :param payload: Frame payload, which must be immutable bytes
+        :param rsv1: Reserved bit 1
+        :param rsv2: Reserved bit 2
+        :param rsv3: Reserved bit 3
+        :raises FrameError: If frame parameters are invalid
+        """
+        self = cls.__new__(cls)
+        self.fin = fin
+        self.opcode = opcode
+        self.payload = payload
+        self.rsv1 = rsv1
+        self.rsv2 = rsv2
+        self.rsv3 = rsv3
+        self._validate()
+        return self
+
     def _validate(self) -> None:
         """
         Validate frame according to RFC 6455.
 
         :raises FrameError: If frame is invalid
         """
-        if self.opcode not in list(Opcode):
-            raise FrameError(f"Invalid opcode: {self.opcode}")
-
+        # The opcode needs no check here: it is always an Opcode, which
+        # __init__ and parse_frame enforce when converting it.
         if self.opcode in CONTROL_FRAMES:
             if not self.fin:
                 raise FrameError("Control frames must not be fragmented")
@@ -130,52 +170,68 @@ class Frame:
         if any((self.rsv1, self.rsv2, self.rsv3)):
             raise FrameError("Reserved bits must be 0 unless negotiated otherwise")
 
-    def serialize(self, *, mask: bool = False) -> bytes:
+    def serialize(
+        self, *, mask: bool = False, out: Optional[bytearray] = None
+    ) -> Union[bytes, bytearray]:
         """
         Serialize frame to bytes according to RFC 6455.
 
         :param mask: Whether to mask the frame (required for client-to-server frames)
-        :return: Serialized frame as bytes
+        :param out: Optional buffer, e.g. from a :class:`BufferPool`, to write the
+            frame into. It is resized to the length of the frame
+        :return: Serialized frame as bytes, or ``out`` if it was given
         """
-        header_bytes = bytearray()
+        header, payload = self.iovec(mask=mask)
+
+        if out is None:
+            # A single concatenation copies the payload into the frame only once.
+            return header + payload
+
+        header_length = len(header)
+        frame_length = header_length + len(payload)
+        # Resize in place so that a pooled buffer keeps its allocation.
+        if len(out) > frame_length:
+            del out[frame_length:]
+        elif len(out) < frame_length:
+            out.extend(bytes(frame_length - len(out)))
+        out[:header_length] = header
+        out[header_length:] = payload
+        return out
+
+    def iovec(self, *, mask: bool = False) -> List[bytes]:
+        """
+        Serialize frame according to RFC 6455 as separate header and payload
+        buffers, for scatter-gather I/O such as :meth:`socket.socket.sendmsg`.
 
+        :param mask: Whether to mask the frame (required for client-to-server frames)
+        :return: The header and the payload. An unmasked payload is the frame's
+            own payload, not a copy
+        """
         # First byte: FIN + RSV + Opcode
         first_byte = (
-            (0b10000000 if self.fin else 0) | (0b01000000 if self.rsv1 else 0) | (0b00100000 if self.rsv2 else 0) | (0b00010000 if self.rsv3 else 0) | self.opcode
+            self.fin << 7 | self.rsv1 << 6 | self.rsv2 << 5 | self.rsv3 << 4 | self.opcode
         )
-        header_bytes.append(first_byte)
 
-        # Second byte: Mask + Payload length
-        payload_length = len(self.payload)
+        # Second byte: Mask + Payload length, followed by the extended length
+        payload = self.payload
+        payload_length = len(payload)
+        mask_bit = 0b10000000 if mask else 0
         if payload_length <= 125:
-            second_byte = payload_length
+            header = _pack_header(first_byte, mask_bit | payload_length)
         elif payload_length <= 65535:
-            second_byte = 126
+            header = _pack_header_16(first_byte, mask_bit | 126, payload_length)
         else:
-            second_byte = 127
-
-        if mask:
-            second_byte |= 0b10000000
-
-        header_bytes.append(second_byte)
-
-        # Extended payload length
-        if payload_length > 125:
-            if payload_length <= 65535:
-                header_bytes.extend(struct.pack("!H", payload_length))
-            else:
-                header_bytes.extend(struct.pack("!Q", payload_length))
+            header = _pack_header_64(first_byte, mask_bit | 127, payload_length)
 
         # Masking key and payload
         if mask:
             import os
             mask_key = os.urandom(4)
-            header_bytes.extend(mask_key)
-            payload = apply_mask(self.payload, mask_key)
-        else:
-            payload = self.payload
+            header += mask_key
+            if payload_length:
+                payload = apply_mask(payload, mask_key)
 
-        return bytes(header_bytes) + payload
+        return [header, payload]
 
     @property
     def is_control(self) -> bool:
@@ -208,69 +264,128 @@ def parse_frame(data: Union[bytes, bytearray], *, max_size: Optional[int] = None
     if len(data) < 2:
         raise FrameError("Frame too short")
 
-    # Parse first byte
-    first_byte = data[0]
-    fin = bool(first_byte & 0b10000000)
-    rsv1 = bool(first_byte & 0b01000000)
-    rsv2 = bool(first_byte & 0b00100000)
-    rsv3 = bool(first_byte & 0b00010000)
-    opcode = first_byte & 0b00001111
-
-    try:
-        opcode = Opcode(opcode)
-    except ValueError:
-        raise FrameError(f"Invalid opcode: {opcode}")
-
-    # Parse second byte
-    second_byte = data[1]
-    masked = bool(second_byte & 0b10000000)
-    payload_length = second_byte & 0b01111111
-
-    # Current position in data
-    pos = 2
-
-    # Handle extended payload length
-    if payload_length == 126:
-        if len(data) < pos + 2:
-            raise FrameError("Frame too short for 2-byte payload length")
-        payload_length = struct.unpack("!H", data[pos:pos + 2])[0]
-        pos += 2
-    elif payload_length == 127:
-        if len(data) < pos + 8:
-            raise FrameError("Frame too short for 8-byte payload length")
-        payload_length = struct.unpack("!Q", data[pos:pos + 8])[0]
-        pos += 8
-
-    if max_size is not None and payload_length > max_size:
-        raise PayloadError(f"Payload length {payload_length} exceeds maximum size {max_size}")
-
-    # Handle mask
-    mask_key = None
-    if masked:
-        if len(data) < pos + 4:
-            raise FrameError("Frame too short for mask key")
-        mask_key = data[pos:pos + 4]
-        pos += 4
-
-    # Check if we have the full payload
-    if len(data) < pos + payload_length:
-        raise FrameError("Frame too short for payload")
-
-    # Extract payload
-    payload = data[pos:pos + payload_length]
-    if masked:
-        payload = apply_mask(payload, mask_key)
+    # The second byte holds the mask bit and the payload length class, which
+    # together select the parser for the shape of the header.
+    return _FRAME_PARSERS[data[1]](data, 0, max_size)
 
-    frame = Frame(
-        fin=fin,
-        opcode=opcode,
-        payload=payload,
-        rsv1=rsv1,
-        rsv2=rsv2,
-        rsv3=rsv3,
+
+def parse_frames(
+    data: Union[bytes, bytearray], *, max_size: Optional[int] = None
+) -> Iterator[Tuple[Frame, int]]:
+    """
+    Parse consecutive WebSocket frames from bytes, stopping at the first frame
+    that is incomplete or invalid.
+
+    .. note::
+        ``data`` is read in place, so it must not be modified until the iteration
+        is over. Delete the consumed bytes afterwards, all at once.
+
+    :param data: Raw frame data
+    :param max_size: Maximum allowed payload size
+    :return: Iterator of (parsed frame, offset of the end of the frame in data)
+    :raises PayloadError: If a payload exceeds max_size
+    """
+    parsers = _FRAME_PARSERS
+    pos = 0
+    length = len(data)
+    while length - pos >= 2:
+        try:
+            frame, pos = parsers[data[pos + 1]](data, pos, max_size)
+        except FrameError:
+            return
+        yield frame, pos
+
+
+def _make_frame_parser(
+    length_size: int, masked: bool
+) -> Callable[[Union[bytes, bytearray], int, Optional[int]], Tuple[Frame, int]]:
+    """
+    Create a frame parser specialized for one header shape.
+
+    :param length_size: Size of the extended payload length: 0, 2 or 8 bytes
+    :param masked: Whether the header ends with a mask key
+    :return: A function parsing a frame of that shape that starts at an offset
+        in the data, returning the frame and the offset of its end
+    """
+    length_end = 2 + length_size
+    header_size = length_end + 4 if masked else length_end
+    unpack_length = _unpack_length_64 if length_size == 8 else _unpack_length_16
+    length_error = f"Frame too short for {length_size}-byte payload length"
+
+    def parse(
+        data: Union[bytes, bytearray], pos: int, max_size: Optional[int]
+    ) -> Tuple[Frame, int]:
+        # Parse first byte
+        first_byte = data[pos]
+        opcode = first_byte & 0b00001111
+        try:
+            opcode = Opcode(opcode)
+        except ValueError:
+            raise FrameError(f"Invalid opcode: {opcode}")
+
+        if not length_size:
+            payload_length = data[pos + 1] & 0b01111111
+        elif len(data) < pos + length_end:
+            raise FrameError(length_error)
+        else:
+            payload_length = unpack_length(data, pos + 2)[0]
+
+        if max_size is not None and payload_length > max_size:
+            raise PayloadError(f"Payload length {payload_length} exceeds maximum size {max_size}")
+
+        # Check if we have the full header and payload
+        payload_start = pos + header_size
+        end = payload_start + payload_length
+        if len(data) < end:
+            if masked and len(data) < payload_start:
+                raise FrameError("Frame too short for mask key")
+            raise FrameError("Frame too short for payload")
+
+        fin = first_byte >= 0b10000000
+        rsv = first_byte & 0b01110000
+        if rsv:
+            rsv1 = rsv >= 0b01000000
+            rsv2 = rsv & 0b00100000 != 0
+            rsv3 = rsv & 0b00010000 != 0
+        else:
+            # Reserved bits are almost never set, as no extension is negotiated.
+            rsv1 = rsv2 = rsv3 = False
+
+        # Extract payload, copying it exactly once: the mask key and payload are
+        # read through views of the buffer, and the frame takes ownership of the
+        # resulting bytes. The view is released before returning so the caller
+        # can resize data.
+        with memoryview(data) as view:
+            payload = view[payload_start:end]
+            if masked and payload_length:
+                payload = apply_mask(payload, view[payload_start - 4:payload_start])
+            else:
+                payload = bytes(payload)
+
+        return Frame._from_raw(fin, opcode, payload, rsv1, rsv2, rsv3), end
+
+    return parse
+
+
+def _build_frame_parsers() -> Tuple[
+    Callable[[Union[bytes, bytearray], int, Optional[int]], Tuple[Frame, int]], ...
+]:
+    """Build the table of frame parsers indexed by the second byte of a frame."""
+    parsers = {
+        (length_size, masked): _make_frame_parser(length_size, masked)
+        for length_size in (0, 2, 8)
+        for masked in (False, True)
+    }
+    length_sizes = {126: 2, 127: 8}
+    return tuple(
+        parsers[length_sizes.get(second_byte & 0b01111111, 0), second_byte >= 0b10000000]
+        for second_byte in range(256)
     )
 
-    return frame, pos + payload_length
+
+# Frame parsers indexed by the second byte of the frame, which holds the mask bit
+# and the payload length class
+_FRAME_PARSERS = _build_frame_parsers()
 
 
 def create_frame(
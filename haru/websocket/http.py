@@ -5,7 +5,9 @@ import collections
 import email.utils
 import hashlib
 import http
+import itertools
 import re
+import time
 from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from .exceptions import HandshakeError, HeaderError, SecurityError
@@ -20,6 +22,22 @@ __all__ = [
 ]
 
 
+# GUID appended to Sec-WebSocket-Key to compute Sec-WebSocket-Accept (RFC 6455)
+_ACCEPT_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Encoded status lines by status code, filled in as responses are built
+_STATUS_LINES: Dict[int, bytes] = {}
+
+# The second the cached Date header value was formatted in, and that value
+_date_cache: Tuple[int, str] = (-1, "")
+
+# Matchers for header names and values, checked for every header of a handshake
+_match_header_name = re.compile(r"[!#$%&'*+\-.^_`|~0-9a-zA-Z]+").fullmatch
+_match_header_value = re.compile(r"[ \t]*[\x21-\x7E\x80-\xFF]*[ \t]*").fullmatch
+# Finds "upgrade" as one of the comma-separated tokens of a Connection header
+_search_upgrade_token = re.compile(r"(?:^|,)\s*upgrade\s*(?:,|$)", re.IGNORECASE).search
+
+
 class Headers(collections.abc.MutableMapping):
     """
     Case-insensitive HTTP headers collection.
@@ -31,11 +49,12 @@ class Headers(collections.abc.MutableMapping):
     :param headers: Initial headers data
     """
 
-    __slots__ = ('_dict', '_list')
+    __slots__ = ('_dict', '_list', '_names')
 
     def __init__(self, headers: Optional[Union[Dict[str, str], List[Tuple[str, str]]]] = None) -> None:
         self._dict: Dict[str, List[str]] = {}  # lowercase_name -> [values]
         self._list: List[Tuple[str, str]] = []  # [(name, value)] with original case
+        self._names: Dict[str, str] = {}  # lowercase_name -> first name with original case
 
         if headers:
             if isinstance(headers, dict):
@@ -53,6 +72,7 @@ class Headers(collections.abc.MutableMapping):
         name_lower = name.lower()
         self._dict.setdefault(name_lower, []).append(value)
         self._list.append((name, value))
+        self._names.setdefault(name_lower, name)
 
     def get_all(self, name: str) -> List[str]:
         """
@@ -82,24 +102,26 @@ class Headers(collections.abc.MutableMapping):
     def __setitem__(self, name: str, value: str) -> None:
         """Set a header, removing any existing values."""
         name_lower = name.lower()
+        # Setting a header that is not present yet, as build_response does,
+        # has nothing to remove from the list.
+        if name_lower in self._dict:
+            self._list = [(k, v) for k, v in self._list if k.lower() != name_lower]
+            # The header moves to the end, under the new name.
+            del self._names[name_lower]
         self._dict[name_lower] = [value]
-        self._list = [(k, v) for k, v in self._list if k.lower() != name_lower]
         self._list.append((name, value))
+        self._names[name_lower] = name
 
     def __delitem__(self, name: str) -> None:
         """Remove all values for a header."""
         name_lower = name.lower()
         del self._dict[name_lower]
+        del self._names[name_lower]
         self._list = [(k, v) for k, v in self._list if k.lower() != name_lower]
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over header names (with original case)."""
-        seen = set()
-        for name, _ in self._list:
-            name_lower = name.lower()
-            if name_lower not in seen:
-                seen.add(name_lower)
-                yield name
+        return iter(self._names.values())
 
     def __len__(self) -> int:
         """Return the number of distinct headers."""
@@ -107,7 +129,17 @@ class Headers(collections.abc.MutableMapping):
 
     def __str__(self) -> str:
         """Format headers for HTTP/1.1 transmission."""
-        return "".join(f"{k}: {v}\r\n" for k, v in self._list) + "\r\n"
+        return "".join([f"{k}: {v}\r\n" for k, v in self._list] + ["\r\n"])
+
+    def to_bytes(self) -> bytes:
+        """
+        Format headers for HTTP/1.1 transmission as bytes.
+
+        :return: Encoded headers, including the blank line ending them
+        :raises UnicodeEncodeError: If a header is not ASCII
+        """
+        # Encoding the joined text once is faster than encoding every header.
+        return str(self).encode("ascii")
 
     def __repr__(self) -> str:
         """Return a string representation for debugging."""
@@ -181,22 +213,7 @@ def parse_request(data: bytes) -> Tuple[Request, int]:
     if method != "GET":
         raise HandshakeError(f"Unsupported HTTP method: {method}")
 
-    headers = Headers()
-    for line in lines[1:]:
-        try:
-            name, value = line.split(":", 1)
-        except ValueError:
-            raise HandshakeError(f"Invalid header line: {line}")
-
-        name = name.strip()
-        if not _is_valid_header_name(name):
-            raise HandshakeError(f"Invalid header name: {name}")
-
-        value = value.strip()
-        if not _is_valid_header_value(value):
-            raise HandshakeError(f"Invalid header value: {value}")
-
-        headers.add(name, value)
+    headers = _parse_header_lines(lines)
 
     return Request(method, target, headers), consumed
 
@@ -241,22 +258,7 @@ def parse_response(data: bytes) -> Tuple[Response, int]:
     except ValueError:
         raise HandshakeError(f"Invalid status code: {status}")
 
-    headers = Headers()
-    for line in lines[1:]:
-        try:
-            name, value = line.split(":", 1)
-        except ValueError:
-            raise HandshakeError(f"Invalid header line: {line}")
-
-        name = name.strip()
-        if not _is_valid_header_name(name):
-            raise HandshakeError(f"Invalid header name: {name}")
-
-        value = value.strip()
-        if not _is_valid_header_value(value):
-            raise HandshakeError(f"Invalid header value: {value}")
-
-        headers.add(name, value)
+    headers = _parse_header_lines(lines)
 
     return Response(status_code, reason, headers), consumed
 
@@ -274,29 +276,43 @@ def build_response(
     :param body: Response body
     :return: Encoded response
     """
-    if isinstance(status, http.HTTPStatus):
-        status_code = status.value
-        reason = status.phrase
-    else:
-        status_code = status
-        reason = http.HTTPStatus(status).phrase
+    status_line = _STATUS_LINES.get(status)
+    if status_line is None:
+        if isinstance(status, http.HTTPStatus):
+            status_code = status.value
+            reason = status.phrase
+        else:
+            status_code = status
+            reason = http.HTTPStatus(status).phrase
+        status_line = f"HTTP/1.1 {status_code} {reason}\r\n".encode("ascii")
+        _STATUS_LINES[status_code] = status_line
 
     if headers is None:
         headers = Headers()
 
     if "Date" not in headers:
-        headers["Date"] = email.utils.formatdate(usegmt=True)
+        headers["Date"] = _http_date()
 
     if body is not None:
         headers["Content-Length"] = str(len(body))
 
-    response = f"HTTP/1.1 {status_code} {reason}\r\n{headers}"
-    data = response.encode("ascii")
+    return b"".join((status_line, headers.to_bytes(), body or b""))
 
-    if body is not None:
-        data += body
 
-    return data
+def _http_date() -> str:
+    """
+    Format the current time for the Date header, once per second at most.
+
+    :return: The current date in the format of RFC 7231
+    """
+    global _date_cache
+    now = int(time.time())
+    second, date = _date_cache
+    if second != now:
+        date = email.utils.formatdate(now, usegmt=True)
+        # A single assignment, so concurrent readers never see a torn pair.
+        _date_cache = (now, date)
+    return date
 
 
 def validate_handshake(
@@ -322,7 +338,7 @@ def validate_handshake(
 
     # Connection header must include "Upgrade"
     connection = require_header("Connection")
-    if "upgrade" not in {token.strip().lower() for token in connection.split(",")}:
+    if _search_upgrade_token(connection) is None:
         raise HeaderError("Invalid Connection header: must include 'Upgrade'")
 
     # Upgrade header must be "websocket"
@@ -351,16 +367,48 @@ def validate_handshake(
 
 def _is_valid_header_name(name: str) -> bool:
     """Check if a header name is valid according to RFC 7230."""
-    return bool(re.match(r"^[!#$%&'*+\-.^_`|~0-9a-zA-Z]+$", name))
+    return _match_header_name(name) is not None
 
 
 def _is_valid_header_value(value: str) -> bool:
     """Check if a header value is valid according to RFC 7230."""
-    return bool(re.match(r"^[ \t]*[\x21-\x7E\x80-\xFF]*[ \t]*$", value))
+    return _match_header_value(value) is not None
+
+
+def _parse_header_lines(lines: List[str]) -> Headers:
+    """
+    Parse the header lines following the request or status line.
+
+    :param lines: Lines of the message head, starting with the request or status line
+    :return: Parsed headers
+    :raises HandshakeError: If a header line is malformed
+    """
+    headers = Headers()
+    add = headers.add
+    # islice skips the first line without copying the rest of the list.
+    for line in itertools.islice(lines, 1, None):
+        try:
+            name, value = line.split(":", 1)
+        except ValueError:
+            raise HandshakeError(f"Invalid header line: {line}")
+
+        name = name.strip()
+        if not _is_valid_header_name(name):
+            raise HandshakeError(f"Invalid header name: {name}")
+
+        value = value.strip()
+        if not _is_valid_header_value(value):
+            raise HandshakeError(f"Invalid header value: {value}")
+
+        add(name, value)
+    return headers
 
 
 def _is_valid_key(key: str) -> bool:
     """Check if a Sec-WebSocket-Key is valid."""
+    # 16 bytes always encode to 24 characters ending in two padding characters.
+    if len(key) != 24 or not key.endswith("=="):
+        return False
     try:
         decoded = base64.b64decode(key.encode(), validate=True)
         return len(decoded) == 16
@@ -370,6 +418,9 @@ def _is_valid_key(key: str) -> bool:
 
 def _is_valid_accept(accept: str) -> bool:
     """Check if a Sec-WebSocket-Accept is valid."""
+    # 20 bytes always encode to 28 characters ending in one padding character.
+    if len(accept) != 28 or not accept.endswith("="):
+        return False
     try:
         decoded = base64.b64decode(accept.encode(), validate=True)
         return len(decoded) == 20
@@ -384,6 +435,6 @@ def compute_accept_key(key: str) -> str:
     :param key: Sec-WebSocket-Key header value
     :return: Computed accept key
     """
-    GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
-    accept = hashlib.sha1((key + GUID).encode()).digest()
-    return base64.b64encode(accept).decode()
+    accept = hashlib.sha1(key.encode())
+    accept.update(_ACCEPT_GUID)
+    return base64.b64encode(accept.digest()).decode()
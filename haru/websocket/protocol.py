@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import collections
 import enum
 import logging
 import queue
 import threading
-from typing import List, Optional, Set, Union
+from typing import Deque, List, Optional, Set, Union
 
+from ._pool import BufferPool
 from .exceptions import (
     ConnectionClosed,
-    FrameError,
     ProtocolError,
 )
 from .frames import (
@@ -18,12 +19,16 @@ from .frames import (
     Opcode,
     decode_close_payload,
     encode_close_payload,
-    parse_frame,
+    parse_frames,
 )
-from .utils import BytesLike
+from .utils import BytesLike, Deadline
 
 __all__ = ["WebSocketProtocol", "State", "ConnectionState"]
 
+# Frames with larger payloads are queued as separate header and payload buffers
+# instead of being copied into one buffer.
+SCATTER_THRESHOLD = 16 * 1024
+
 
 class State(enum.IntEnum):
     """
@@ -44,6 +49,10 @@ class ConnectionState:
     """
     Thread-safe connection state management.
 
+    Reading an attribute is atomic, so the properties do not take the lock; it only
+    serializes transitions. The close code and reason are stored before the state
+    becomes CLOSED, so a reader that sees CLOSED also sees them.
+
     :param initial: Initial state
     """
 
@@ -56,20 +65,17 @@ class ConnectionState:
     @property
     def state(self) -> State:
         """Current connection state."""
-        with self._lock:
-            return self._state
+        return self._state
 
     @property
     def close_code(self) -> Optional[int]:
         """Close status code if connection is closed."""
-        with self._lock:
-            return self._close_code
+        return self._close_code
 
     @property
     def close_reason(self) -> Optional[str]:
         """Close reason if connection is closed."""
-        with self._lock:
-            return self._close_reason
+        return self._close_reason
 
     def transition(
         self, to_state: State, code: Optional[int] = None, reason: str = ""
@@ -101,10 +107,10 @@ class ConnectionState:
                     f"Invalid state transition: {current.name} -> {to_state.name}"
                 )
 
-            self._state = to_state
             if to_state == State.CLOSED:
                 self._close_code = code
                 self._close_reason = reason
+            self._state = to_state
 
 
 class WebSocketProtocol:
@@ -120,29 +126,41 @@ class WebSocketProtocol:
 
     :param logger: Logger instance
     :param max_size: Maximum message size in bytes
+    :param client: Whether this is the client side of the connection, which
+        masks the frames it sends (RFC 6455, section 5.1)
     """
 
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
         max_size: Optional[int] = 2**20,
+        client: bool = False,
     ) -> None:
         if logger is None:
             logger = logging.getLogger("simple_websocket.protocol")
         self.logger = logger
+        self.client = client
         self.max_size = max_size
 
         self.state = ConnectionState()
 
         # Frame/message handling
         self._incoming_buffer = bytearray()
-        self._outgoing_queue: queue.Queue[bytes] = queue.Queue()
-        self._message_queue: queue.Queue[Union[str, bytes]] = queue.Queue()
+        # Each item holds the buffers of one frame, so that frames queued from
+        # different threads never interleave. Deque appends and pops are atomic,
+        # so neither queue needs a lock.
+        self._outgoing_queue: Deque[List[BytesLike]] = collections.deque()
+        # Small frames are serialized into pooled buffers until they are sent.
+        self._buffer_pool = BufferPool()
+        self._message_queue: Deque[Union[str, bytes]] = collections.deque()
+        # Set after a message is queued, to wake up a blocked receive_message.
+        self._message_event = threading.Event()
 
         # Message fragmentation state
         self._fragmented_message_type: Optional[Opcode] = None
-        self._fragmented_message_buffer: List[bytes] = []
-        self._fragmented_message_size = 0
+        # Continuation payloads are appended in place, so the buffer's length is
+        # the size of the message so far.
+        self._fragmented_message_buffer = bytearray()
 
         # Close frame tracking
         self._close_frame_sent = False
@@ -151,37 +169,33 @@ class WebSocketProtocol:
         # Active pings
         self._pending_pings: Set[bytes] = set()
 
-    def receive_data(self, data: bytes) -> None:
+    def receive_data(self, data: BytesLike) -> None:
         """
         Process incoming WebSocket data.
 
-        :param data: Raw bytes received from socket
+        :param data: Raw bytes received from socket. They are copied into the
+            incoming buffer, so a reused receive buffer may be passed
         :raises ProtocolError: If protocol violation is detected
         """
         if self.state.state == State.CLOSED:
             return
 
-        self._incoming_buffer.extend(data)
-
-        while self._incoming_buffer:
-            # Try to parse a frame
-            try:
-                frame, consumed = parse_frame(
-                    self._incoming_buffer, max_size=self.max_size
-                )
-            except FrameError:
-                # Not enough data for a complete frame
-                break
-
-            # Remove consumed data
-            del self._incoming_buffer[:consumed]
-
-            try:
-                self._handle_frame(frame)
-            except Exception as exc:
-                self.logger.error("Error handling frame", exc_info=True)
-                self.close(CloseCode.PROTOCOL_ERROR, str(exc))
-                raise
+        buffer = self._incoming_buffer
+        buffer.extend(data)
+
+        # Parse every complete frame in the buffer, then remove the consumed data
+        # at once rather than after each frame.
+        consumed = 0
+        try:
+            for frame, consumed in parse_frames(buffer, max_size=self.max_size):
+                try:
+                    self._handle_frame(frame)
+                except Exception as exc:
+                    self.logger.error("Error handling frame", exc_info=True)
+                    self.close(CloseCode.PROTOCOL_ERROR, str(exc))
+                    raise
+        finally:
+            del buffer[:consumed]
 
     def _handle_frame(self, frame: Frame) -> None:
         """
@@ -229,25 +243,24 @@ class WebSocketProtocol:
             if self._fragmented_message_type is None:
                 raise ProtocolError("Unexpected continuation frame")
 
-            self._fragmented_message_buffer.append(frame.payload)
-            self._fragmented_message_size += len(frame.payload)
-
-            if self.max_size and self._fragmented_message_size > self.max_size:
+            buffer = self._fragmented_message_buffer
+            if self.max_size and len(buffer) + len(frame.payload) > self.max_size:
                 raise ProtocolError("Message size exceeds limit")
+            buffer += frame.payload
 
             if frame.fin:
                 # Message is complete
-                message = b"".join(self._fragmented_message_buffer)
                 if self._fragmented_message_type == Opcode.TEXT:
                     try:
-                        message = message.decode("utf-8")
+                        message: Union[str, bytes] = buffer.decode("utf-8")
                     except UnicodeDecodeError:
                         raise ProtocolError("Invalid UTF-8 in text message")
+                else:
+                    message = bytes(buffer)
 
-                self._message_queue.put(message)
+                self._queue_message(message)
                 self._fragmented_message_type = None
-                self._fragmented_message_buffer.clear()
-                self._fragmented_message_size = 0
+                del buffer[:]
 
         else:  # New message
             if self._fragmented_message_type is not None:
@@ -260,15 +273,14 @@ class WebSocketProtocol:
                         message = frame.payload.decode("utf-8")
                     except UnicodeDecodeError:
                         raise ProtocolError("Invalid UTF-8 in text message")
-                    self._message_queue.put(message)
+                    self._queue_message(message)
                 else:
-                    self._message_queue.put(frame.payload)
+                    self._queue_message(frame.payload)
 
             else:
                 # Start of fragmented message
                 self._fragmented_message_type = frame.opcode
-                self._fragmented_message_buffer = [frame.payload]
-                self._fragmented_message_size = len(frame.payload)
+                self._fragmented_message_buffer[:] = frame.payload
 
     def _handle_close(self, code: int, reason: str) -> None:
         """
@@ -287,6 +299,29 @@ class WebSocketProtocol:
         if self.state.state != State.CLOSED:
             self.state.transition(State.CLOSED, code, reason)
 
+        # Wake up receive_message, which raises now that no message can arrive
+        self._message_event.set()
+
+    def connection_lost(self) -> None:
+        """
+        Mark the connection as closed once the transport can no longer be read,
+        unless the closing handshake has completed, and wake up receive_message.
+        """
+        try:
+            self.state.transition(State.CLOSED, CloseCode.ABNORMAL_CLOSURE, "")
+        except ValueError:
+            # Already closed, possibly by another thread since it was checked
+            pass
+        self._message_event.set()
+
+    def _connection_closed(self) -> ConnectionClosed:
+        """Create the error raised when using the closed connection."""
+        return ConnectionClosed(
+            "Connection is closed",
+            code=self.state.close_code,
+            reason=self.state.close_reason,
+        )
+
     def send_frame(self, frame: Frame) -> None:
         """
         Queue a frame for sending.
@@ -294,11 +329,45 @@ class WebSocketProtocol:
         :param frame: Frame to send
         :raises ConnectionClosed: If connection is closed
         """
+        self._outgoing_queue.append(self.serialize_frame(frame))
+
+    def serialize_frame(self, frame: Frame) -> List[BytesLike]:
+        """
+        Serialize a frame for sending without queueing it, for callers that send
+        it themselves. Pass the result to :meth:`release_outgoing_buffers` once
+        sent.
+
+        :param frame: Frame to serialize
+        :return: Buffers to send in order
+        :raises ConnectionClosed: If connection is closed
+        """
         if self.state.state == State.CLOSED:
-            raise ConnectionClosed(self.state.close_code, self.state.close_reason)
+            raise self._connection_closed()
 
-        data = frame.serialize(mask=True)  # Client always masks
-        self._outgoing_queue.put(data)
+        # Only clients mask their frames
+        mask = self.client
+        if len(frame.payload) > SCATTER_THRESHOLD:
+            return frame.iovec(mask=mask)
+        buffer = self._buffer_pool.acquire(len(frame.payload) + 14)
+        return [frame.serialize(mask=mask, out=buffer)]
+
+    def send_serialized(self, data: bytes) -> None:
+        """
+        Queue an already serialized frame for sending, e.g. one shared by many
+        connections. It must be masked if and only if this is a client.
+
+        :param data: Serialized frame
+        :raises ConnectionClosed: If connection is closed
+        """
+        if self.state.state == State.CLOSED:
+            raise self._connection_closed()
+
+        self._outgoing_queue.append([data])
+
+    @property
+    def has_outgoing_data(self) -> bool:
+        """Whether frames are queued for sending."""
+        return bool(self._outgoing_queue)
 
     def get_outgoing_data(self) -> bytes:
         """
@@ -306,14 +375,38 @@ class WebSocketProtocol:
 
         :return: Data to send
         """
-        data = bytearray()
+        buffers = self.get_outgoing_buffers()
+        data = b"".join(buffers)
+        self.release_outgoing_buffers(buffers)
+        return data
+
+    def get_outgoing_buffers(self) -> List[BytesLike]:
+        """
+        Get queued outgoing data as a list of buffers to send in order, without
+        joining them. Pass the list to :meth:`release_outgoing_buffers` once sent.
+
+        :return: Buffers to send
+        """
+        buffers: List[BytesLike] = []
+        pop = self._outgoing_queue.popleft
         while True:
             try:
-                chunk = self._outgoing_queue.get_nowait()
-                data.extend(chunk)
-            except queue.Empty:
+                buffers.extend(pop())
+            except IndexError:
                 break
-        return bytes(data)
+        return buffers
+
+    def release_outgoing_buffers(self, buffers: List[BytesLike]) -> None:
+        """
+        Return sent buffers from :meth:`get_outgoing_buffers` for reuse.
+
+        :param buffers: Buffers that have been sent
+        """
+        release = self._buffer_pool.release
+        for buffer in buffers:
+            # Only the pooled buffers are bytearrays; frame parts are bytes.
+            if isinstance(buffer, bytearray):
+                release(buffer)
 
     def receive_message(self, *, timeout: Optional[float] = None) -> Union[str, bytes]:
         """
@@ -325,9 +418,25 @@ class WebSocketProtocol:
         :raises queue.Empty: If timeout occurs
         """
         if self.state.state == State.CLOSED:
-            raise ConnectionClosed(self.state.close_code, self.state.close_reason)
+            raise self._connection_closed()
 
-        return self._message_queue.get(timeout=timeout)
+        deadline = Deadline(timeout)
+        while True:
+            # Clear before checking, so a message queued after the check sets
+            # the event again and the wait below returns.
+            self._message_event.clear()
+            try:
+                return self._message_queue.popleft()
+            except IndexError:
+                pass
+            if self.state.state == State.CLOSED:
+                raise self._connection_closed()
+            if not self._message_event.wait(deadline.remaining()):
+                raise queue.Empty
+
+    def _queue_message(self, message: Union[str, bytes]) -> None:
+        self._message_queue.append(message)
+        self._message_event.set()
 
     def send_message(self, message: Union[str, bytes]) -> None:
         """
@@ -337,6 +446,17 @@ class WebSocketProtocol:
         :raises ConnectionClosed: If connection is closed
         :raises TypeError: If message type is invalid
         """
+        self._outgoing_queue.append(self.serialize_message(message))
+
+    def serialize_message(self, message: Union[str, bytes]) -> List[BytesLike]:
+        """
+        Serialize a message like :meth:`serialize_frame`, without queueing it.
+
+        :param message: Message to serialize
+        :return: Buffers to send in order
+        :raises ConnectionClosed: If connection is closed
+        :raises TypeError: If message type is invalid
+        """
         if isinstance(message, str):
             frame = Frame(True, Opcode.TEXT, message.encode())
         elif isinstance(message, (bytes, bytearray, memoryview)):
@@ -344,7 +464,7 @@ class WebSocketProtocol:
         else:
             raise TypeError("Message must be str or bytes-like object")
 
-        self.send_frame(frame)
+        return self.serialize_frame(frame)
 
     def ping(self, data: BytesLike = b"") -> None:
         """
@@ -383,7 +503,7 @@ class WebSocketProtocol:
         :raises ConnectionClosed: If connection is already closed
         """
         if self.state.state == State.CLOSED:
-            raise ConnectionClosed(self.state.close_code, self.state.close_reason)
+            raise self._connection_closed()
 
         if not self._close_frame_sent:
             frame = Frame(True, Opcode.CLOSE, encode_close_payload(code, reason))
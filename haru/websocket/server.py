@@ -1,21 +1,274 @@
 from __future__ import annotations
 
+import collections
+import contextlib
 import logging
+import os
+import selectors
 import socket
 import ssl
+import tempfile
 import threading
 import weakref
-from typing import Any, Callable, Optional, Set, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from .exceptions import ConnectionClosed, HandshakeError
-from .frames import CloseCode
-from .http import Headers, build_response, parse_request, validate_handshake
+from .frames import CloseCode, Opcode, create_frame
+from .http import (
+    Headers,
+    Request,
+    build_response,
+    compute_accept_key,
+    parse_request,
+    validate_handshake,
+)
 from .protocol import State, WebSocketProtocol
-from .utils import compute_accept_key
+from .utils import BytesLike
 
 __all__ = ["WebSocketServer", "WebSocketHandler", "serve", "serve_ssl"]
 
 
+# Maximum number of buffers passed to one sendmsg call (the usual IOV_MAX)
+_IOV_MAX = 1024
+
+# Flag for a recv that does not block on a blocking socket, where available
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+# Most reads of a connection in one round of the reactor
+_MAX_DRAIN_READS = 16
+
+# Broadcast frames from this size up are sent to each client from a file with
+# sendfile, rather than copied from user space once per client
+SENDFILE_THRESHOLD = 64 * 1024
+
+
+def _frame_file(data: bytes) -> BinaryIO:
+    """
+    Write a serialized frame to an anonymous file to send it with sendfile.
+
+    :param data: Serialized frame
+    :return: The file, which the caller closes
+    """
+    if hasattr(os, "memfd_create"):
+        # Kept in memory, never written back to disk
+        file: BinaryIO = open(os.memfd_create("haru-broadcast"), "w+b")
+    else:
+        file = tempfile.TemporaryFile()
+    file.write(data)
+    file.flush()
+    return file
+
+
+def _send_buffers(sock: socket.socket, buffers: List[BytesLike]) -> None:
+    """
+    Send buffers in order, with scatter-gather I/O where the socket supports it
+    so that they are not joined first.
+
+    :param sock: Connected socket
+    :param buffers: Buffers to send. The list is modified
+    """
+    if len(buffers) == 1:
+        sock.sendall(buffers[0])
+        return
+    # SSL sockets do not implement sendmsg, and Windows sockets lack it.
+    if isinstance(sock, ssl.SSLSocket) or not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(buffers))
+        return
+
+    index = 0
+    count = len(buffers)
+    while index < count:
+        sent = sock.sendmsg(buffers[index:index + _IOV_MAX])
+        # Skip the buffers sent completely and resume within a partly sent one.
+        while index < count and sent >= len(buffers[index]):
+            sent -= len(buffers[index])
+            index += 1
+        if sent:
+            buffers[index] = memoryview(buffers[index])[sent:]
+
+
+def _send_nowait(sock: socket.socket, buffers: List[BytesLike]) -> int:
+    """
+    Send as much of the buffers, in order, as the socket takes without blocking.
+
+    :param sock: Connected socket, not an SSL socket
+    :param buffers: Buffers to send
+    :return: Number of bytes sent, 0 if the socket buffer is full
+    """
+    try:
+        return sock.sendmsg(buffers[:_IOV_MAX], (), _MSG_DONTWAIT)
+    except BlockingIOError:
+        return 0
+
+
+class _Reactor:
+    """
+    Reads the connections of a server from one thread with a selector, instead of
+    one reader thread per connection. The replies it sends never block: what a
+    socket does not take is kept, and the connection is watched for writing
+    instead of reading until it has been sent, so that a client that does not
+    read stalls only its own connection.
+
+    Selectors are not thread-safe, so other threads only queue requests to start
+    or stop reading a connection; the reactor thread applies them when woken up
+    through a socket pair.
+
+    :param logger: Logger instance
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self._lock = threading.Lock()
+        # (whether to start reading, handler); a None handler stops the thread
+        self._requests: Deque[Tuple[bool, Optional[WebSocketHandler]]] = (
+            collections.deque()
+        )
+        self._wakeup: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, handler: WebSocketHandler) -> None:
+        """
+        Start reading a connection, starting the reactor thread if needed.
+
+        :param handler: Handler of the connection
+        """
+        with self._lock:
+            if self._thread is None:
+                self._start()
+            self._request(True, handler)
+
+    def discard(self, handler: WebSocketHandler) -> None:
+        """
+        Stop reading a connection. Its close event is set once the reactor no
+        longer watches the socket, after which the socket may be closed.
+
+        :param handler: Handler of the connection
+        """
+        with self._lock:
+            if self._thread is None:
+                handler._reading_stopped()
+            else:
+                self._request(False, handler)
+
+    def stop(self) -> None:
+        """Stop the reactor thread, if running, and wait for it to exit."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._request(False, None)
+            self._thread = None
+        thread.join()
+
+    def _start(self) -> None:
+        selector = selectors.DefaultSelector()
+        receiver, self._wakeup = socket.socketpair()
+        receiver.setblocking(False)
+        self._wakeup.setblocking(False)
+        selector.register(receiver, selectors.EVENT_READ)
+        self._thread = threading.Thread(
+            target=self._run, args=(selector, receiver, self._wakeup), daemon=True
+        )
+        self._thread.start()
+
+    def _request(self, add: bool, handler: Optional[WebSocketHandler]) -> None:
+        self._requests.append((add, handler))
+        try:
+            self._wakeup.send(b"\0")
+        except OSError:
+            # The socket pair is full, so a wakeup is already pending.
+            pass
+
+    def _run(
+        self,
+        selector: selectors.BaseSelector,
+        receiver: socket.socket,
+        wakeup: socket.socket,
+    ) -> None:
+        """Read the connections whose sockets are ready until stopped."""
+        try:
+            while True:
+                woken = False
+                for key, events in selector.select():
+                    handler = key.data
+                    if handler is None:
+                        woken = True
+                        continue
+                    if events & selectors.EVENT_WRITE:
+                        keep = handler._resume_sending()
+                    else:
+                        keep = handler._receive()
+                    if not keep:
+                        self._unregister(selector, handler)
+                        continue
+                    wanted = selectors.EVENT_WRITE if handler._unsent else selectors.EVENT_READ
+                    if wanted != key.events:
+                        selector.modify(handler.socket, wanted, handler)
+                # Requests are applied after the events, so that no event is
+                # handled for a socket discarded in the same round.
+                if woken and not self._apply_requests(selector, receiver):
+                    return
+        except Exception:
+            self.logger.exception("Error in reactor")
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    key.data._reading_stopped()
+            selector.close()
+            receiver.close()
+            wakeup.close()
+
+    def _apply_requests(
+        self, selector: selectors.BaseSelector, receiver: socket.socket
+    ) -> bool:
+        """
+        Apply the queued requests.
+
+        :return: False if the reactor was asked to stop
+        """
+        try:
+            while receiver.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        requests = self._requests
+        while requests:
+            add, handler = requests.popleft()
+            if handler is None:
+                return False
+            if not add:
+                self._unregister(selector, handler)
+                continue
+            try:
+                selector.register(handler.socket, selectors.EVENT_READ, handler)
+            except (KeyError, ValueError, OSError):
+                # Already registered, or closed before the request was applied
+                handler._reading_stopped()
+        return True
+
+    @staticmethod
+    def _unregister(
+        selector: selectors.BaseSelector, handler: WebSocketHandler
+    ) -> None:
+        try:
+            selector.unregister(handler.socket)
+        except (KeyError, ValueError):
+            pass
+        handler._reading_stopped()
+
+
 class WebSocketHandler:
     """
     Handler for a single WebSocket connection.
@@ -39,6 +292,8 @@ class WebSocketHandler:
         self.server = server
         self.handler = handler
         self.protocol = WebSocketProtocol(logger=logger, max_size=max_size)
+        # The opening handshake request, once it has been received
+        self.request: Optional[Request] = None
 
         # Set TCP_NODELAY to disable Nagle's algorithm
         self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
@@ -46,7 +301,19 @@ class WebSocketHandler:
         self._thread: Optional[threading.Thread] = None
         self._running = True
         self._send_lock = threading.Lock()
+        # Set once incoming data is no longer read, after reading has started
         self._close_event = threading.Event()
+        self._reading = False
+        # Depth of nested corked() blocks; messages are only queued while positive
+        self._corked = 0
+        # Incoming data is received into this buffer instead of a new bytes object
+        # per recv; the protocol copies the data out before the next read.
+        self._recv_buffer = bytearray(65536)
+        self._recv_view = memoryview(self._recv_buffer)
+        # Flags to read more without blocking; SSL sockets do not accept flags.
+        self._drain_flags = 0 if isinstance(sock, ssl.SSLSocket) else _MSG_DONTWAIT
+        # Data the reactor could not send without blocking, sent before any other
+        self._unsent: List[BytesLike] = []
 
     def start(self) -> None:
         """Start handling the connection in a new thread."""
@@ -72,14 +339,14 @@ class WebSocketHandler:
             if self.protocol.state.state != State.OPEN:
                 return
 
-            # Start reader thread
-            reader_thread = threading.Thread(target=self._reader_loop)
-            reader_thread.daemon = True
-            reader_thread.start()
+            self._start_reading()
 
             try:
                 # Run user handler
                 self.handler(self)
+            except ConnectionClosed:
+                # The peer closed the connection while the handler was using it
+                self.close()
             except Exception:
                 self.protocol.logger.exception("Error in connection handler")
                 self.close(CloseCode.INTERNAL_ERROR)
@@ -87,9 +354,6 @@ class WebSocketHandler:
                 # Normal closure
                 self.close(CloseCode.NORMAL)
 
-            # Wait for reader thread
-            reader_thread.join()
-
         except ConnectionClosed:
             pass
         except Exception:
@@ -118,6 +382,7 @@ class WebSocketHandler:
         except Exception as exc:
             raise HandshakeError("Invalid WebSocket headers") from exc
 
+        # validate_handshake has checked the key, so it is not decoded again here
         key = request.headers["Sec-WebSocket-Key"]
         accept = compute_accept_key(key)
 
@@ -135,34 +400,228 @@ class WebSocketHandler:
         with self._send_lock:
             self.socket.sendall(response)
 
+        self.request = request
         # Update protocol state
         self.protocol.state.transition(State.OPEN)
 
+    def _start_reading(self) -> None:
+        """Start reading incoming data, on the server's reactor if possible."""
+        self._reading = True
+        # Reading an SSL socket may block until a whole TLS record has arrived,
+        # which would stall every connection on the reactor, so those connections
+        # are read by a thread of their own. So are those that cannot be written
+        # without blocking, where MSG_DONTWAIT is missing.
+        if not self._drain_flags:
+            reader_thread = threading.Thread(target=self._reader_loop)
+            reader_thread.daemon = True
+            reader_thread.start()
+        else:
+            self.server._reactor.add(self)
+
+    def _stop_reading(self) -> None:
+        """Make sure the reactor no longer watches the socket before closing it."""
+        # Sockets read by a thread stop it when closed.
+        if not self._reading or not self._drain_flags:
+            return
+        if not self._close_event.is_set():
+            self.server._reactor.discard(self)
+            self._close_event.wait(timeout=5.0)
+
     def _reader_loop(self) -> None:
         """Read incoming data from the socket."""
         try:
-            while self._running:
-                try:
-                    data = self.socket.recv(65536)
-                    if not data:
-                        break
+            while self._receive():
+                pass
+        finally:
+            self._reading_stopped()
 
-                    self.protocol.receive_data(data)
+    def _reading_stopped(self) -> None:
+        """Called once incoming data is no longer read, by the reader."""
+        self.protocol.connection_lost()
+        self._close_event.set()
 
-                    # Send any queued outgoing data
-                    outgoing = self.protocol.get_outgoing_data()
-                    if outgoing:
-                        with self._send_lock:
-                            self.socket.sendall(outgoing)
+    def _receive(self) -> bool:
+        """
+        Receive and process the data available on the socket. Called by the
+        reactor when the socket is readable, or in a loop by the reader thread.
 
-                except ConnectionClosed:
+        :return: Whether to keep reading
+        """
+        view = self._recv_view
+        try:
+            size = self.socket.recv_into(view)
+            if not size:
+                return False
+
+            self.protocol.receive_data(view[:size])
+
+            # A full buffer means more data is likely waiting. Read it before
+            # replying, so the replies to a burst of frames go out in one send,
+            # but only so much, or a client that keeps sending would hold the
+            # reactor here.
+            reads = 1
+            while size == len(view) and self._drain_flags and reads < _MAX_DRAIN_READS:
+                reads += 1
+                try:
+                    size = self.socket.recv_into(view, 0, self._drain_flags)
+                except BlockingIOError:
                     break
-                except Exception:
-                    self.protocol.logger.exception("Error in reader loop")
-                    self.close(CloseCode.INTERNAL_ERROR)
+                # At the end of the stream the next read reports it again.
+                if not size:
                     break
+                self.protocol.receive_data(view[:size])
+
+            # Send the replies, such as pongs, without waiting: the reactor does
+            # not wait for a send, and a reader thread does not wait for another
+            # thread's send, which then sends them too.
+            if self._drain_flags:
+                self._flush_nowait()
+            else:
+                self._flush_outgoing(blocking=False)
+
+        except ConnectionClosed:
+            return False
+        except Exception:
+            # Reads fail once close() has shut the socket down, which is expected.
+            if self._running:
+                self.protocol.logger.exception("Error in reader loop")
+                self._abort(CloseCode.INTERNAL_ERROR)
+            return False
+        return self._running
+
+    def _resume_sending(self) -> bool:
+        """
+        Send the data left over by the reactor, once the socket is writable.
+
+        :return: Whether to keep watching the socket
+        """
+        try:
+            self._flush_nowait()
+        except Exception:
+            if self._running:
+                self.protocol.logger.exception("Error in reader loop")
+                self._abort(CloseCode.INTERNAL_ERROR)
+            return False
+        return self._running
+
+    def _abort(self, code: int) -> None:
+        """
+        Send a close frame and shut the socket down without waiting for the
+        closing handshake, as the reading side cannot wait for itself.
+
+        :param code: Close status code
+        """
+        if not self._running:
+            return
+
+        self._running = False
+
+        try:
+            self.protocol.close(code)
+            if self._drain_flags:
+                self._flush_nowait()
+            else:
+                self._flush_outgoing(blocking=False)
+        except Exception:
+            pass
+
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+
+    def _flush_outgoing(
+        self, parts: Optional[List[BytesLike]] = None, blocking: bool = True
+    ) -> None:
+        """
+        Send the data queued by the protocol.
+
+        :param parts: A serialized frame to send right after the queued data, in
+            the same system call, without queueing it first
+        :param blocking: Whether to wait for another thread's send to finish.
+            If not, that thread sends the queued data instead
+        """
+        # Collect under the lock too, so that batches taken by different
+        # threads are sent in the order they were queued.
+        while self._send_lock.acquire(blocking):
+            try:
+                while True:
+                    buffers = self._take_outgoing()
+                    if parts:
+                        buffers.extend(parts)
+                        parts = None
+                    if not buffers:
+                        break
+                    _send_buffers(self.socket, list(buffers))
+                    self.protocol.release_outgoing_buffers(buffers)
+            finally:
+                self._send_lock.release()
+            # Data queued by a thread that found the lock taken just before it
+            # was released is still pending; send it unless someone else does.
+            if not self.protocol.has_outgoing_data:
+                break
+            blocking = False
+
+    def _take_outgoing(self) -> List[BytesLike]:
+        """
+        Take the data to send next, with what the reactor left over first. Called
+        with the send lock held.
+
+        :return: Buffers to send in order
+        """
+        buffers = self.protocol.get_outgoing_buffers()
+        if self._unsent:
+            buffers[:0] = self._unsent
+            self._unsent = []
+        return buffers
+
+    def _flush_nowait(self) -> None:
+        """
+        Send the queued data as far as the socket takes it without blocking,
+        keeping the rest in ``_unsent``. Used by the reactor, which must not wait.
+        If another thread is sending, it sends the queued data instead.
+        """
+        if not self._send_lock.acquire(False):
+            return
+        try:
+            unsent = self._unsent
+            unsent.extend(self.protocol.get_outgoing_buffers())
+            while unsent:
+                sent = _send_nowait(self.socket, unsent)
+                if not sent:
+                    return
+                # Release the buffers sent completely and keep the rest of one
+                # sent in part.
+                done = 0
+                while done < len(unsent) and sent >= len(unsent[done]):
+                    sent -= len(unsent[done])
+                    done += 1
+                self.protocol.release_outgoing_buffers(unsent[:done])
+                del unsent[:done]
+                if sent:
+                    unsent[0] = memoryview(unsent[0])[sent:]
+        finally:
+            self._send_lock.release()
+
+    def flush(self) -> None:
+        """Send any messages held back by :meth:`corked`."""
+        self._flush_outgoing()
+
+    @contextlib.contextmanager
+    def corked(self) -> Iterator[None]:
+        """
+        Hold back the messages sent within the block and send them together when
+        it exits, with one system call, instead of one packet per message.
+
+        Blocks may be nested; messages are sent when the outermost one exits.
+        """
+        self._corked += 1
+        try:
+            yield
         finally:
-            self._close_event.set()
+            self._corked -= 1
+            if not self._corked:
+                self._flush_outgoing()
 
     def send(self, message: Union[str, bytes]) -> None:
         """
@@ -171,11 +630,45 @@ class WebSocketHandler:
         :param message: Message to send
         :raises ConnectionClosed: If connection is closed
         """
-        self.protocol.send_message(message)
-        outgoing = self.protocol.get_outgoing_data()
-        if outgoing:
-            with self._send_lock:
-                self.socket.sendall(outgoing)
+        if self._corked:
+            self.protocol.send_message(message)
+        else:
+            self._flush_outgoing(self.protocol.serialize_message(message))
+
+    def send_serialized(self, data: bytes) -> None:
+        """
+        Send an already serialized, unmasked frame to the client.
+
+        :param data: Serialized frame
+        :raises ConnectionClosed: If connection is closed
+        """
+        self.protocol.send_serialized(data)
+        if not self._corked:
+            self._flush_outgoing()
+
+    def _send_file(self, file: BinaryIO, data: bytes) -> None:
+        """
+        Send a serialized frame, also written to a file, with sendfile.
+
+        :param file: File holding exactly the serialized frame
+        :param data: Serialized frame, sent as is where sendfile does not apply
+        :raises ConnectionClosed: If connection is closed
+        """
+        # sendfile cannot encrypt, and held messages must stay in the queue.
+        use_queue = self._corked or isinstance(self.socket, ssl.SSLSocket)
+        if use_queue or self.protocol.state.state == State.CLOSED:
+            self.send_serialized(data)
+            return
+
+        with self._send_lock:
+            # Data queued before the frame goes first
+            buffers = self._take_outgoing()
+            if buffers:
+                _send_buffers(self.socket, list(buffers))
+            self.socket.sendfile(file, 0, len(data))
+        self.protocol.release_outgoing_buffers(buffers)
+        # Send what was queued while the lock was held
+        self._flush_outgoing()
 
     def close(self, code: int = CloseCode.NORMAL, reason: str = "") -> None:
         """
@@ -190,16 +683,19 @@ class WebSocketHandler:
         self._running = False
 
         try:
-            self.protocol.close(code, reason)
-            outgoing = self.protocol.get_outgoing_data()
-            if outgoing:
-                with self._send_lock:
-                    self.socket.sendall(outgoing)
+            if self.protocol.state.state != State.CLOSED:
+                self.protocol.close(code, reason)
+            self._flush_outgoing()
         except Exception:
             self.protocol.logger.exception("Error during close")
 
-        # Wait for reader thread to finish
-        self._close_event.wait(timeout=5.0)
+        if self.protocol.state.state == State.CLOSED:
+            # The peer has already sent its close frame, so there is nothing left
+            # to read; stop at once rather than wait for it to drop the connection.
+            self._stop_reading()
+        elif self._reading and not self._close_event.wait(timeout=5.0):
+            # The peer did not answer the close frame in time.
+            self._stop_reading()
 
         try:
             self.socket.shutdown(socket.SHUT_RDWR)
@@ -219,10 +715,7 @@ class WebSocketHandler:
         :raises ConnectionClosed: If connection is closed
         """
         self.protocol.ping(data)
-        outgoing = self.protocol.get_outgoing_data()
-        if outgoing:
-            with self._send_lock:
-                self.socket.sendall(outgoing)
+        self._flush_outgoing()
 
     def recv(self, timeout: Optional[float] = None) -> Union[str, bytes]:
         """
@@ -244,6 +737,7 @@ class WebSocketHandler:
         """Clean up resources."""
         self._running = False
         self.server._remove_handler(self)
+        self._stop_reading()
 
         try:
             self.socket.close()
@@ -284,6 +778,8 @@ class WebSocketServer:
 
         self._socket: Optional[socket.socket] = None
         self._handlers: weakref.WeakSet[WebSocketHandler] = weakref.WeakSet()
+        # Reads all plain connections; started with the first one
+        self._reactor = _Reactor(logger)
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
@@ -321,6 +817,8 @@ class WebSocketServer:
                     handler.start()
 
                 except Exception:
+                    if not self._running:
+                        break
                     self.logger.exception("Error accepting connection")
 
         except Exception:
@@ -335,8 +833,13 @@ class WebSocketServer:
 
         self._running = False
 
-        # Close server socket
+        # Close server socket, waking up a thread blocked in accept(), which
+        # closing alone does not do
         if self._socket:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self._socket.close()
             except Exception:
@@ -349,6 +852,8 @@ class WebSocketServer:
             except Exception:
                 pass
 
+        self._reactor.stop()
+
     def _remove_handler(self, handler: WebSocketHandler) -> None:
         """Remove a connection handler."""
         self._handlers.discard(handler)
@@ -364,11 +869,29 @@ class WebSocketServer:
 
         :param message: Message to broadcast
         """
-        for handler in self.handlers:
-            try:
-                handler.send(message)
-            except Exception:
-                self.logger.exception("Error broadcasting to client")
+        # Server frames are not masked, so one serialized frame fits every client.
+        if isinstance(message, str):
+            data = create_frame(Opcode.TEXT, message.encode())
+        else:
+            data = create_frame(Opcode.BINARY, message)
+
+        handlers = self.handlers
+        if len(data) < SENDFILE_THRESHOLD or len(handlers) < 2:
+            for handler in handlers:
+                try:
+                    handler.send_serialized(data)
+                except Exception:
+                    self.logger.exception("Error broadcasting to client")
+            return
+
+        # Large frames are written to a file once, and the kernel sends them to
+        # each client from there.
+        with _frame_file(data) as file:
+            for handler in handlers:
+                try:
+                    handler._send_file(file, data)
+                except Exception:
+                    self.logger.exception("Error broadcasting to client")
 
 
 def serve(
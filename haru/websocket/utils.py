@@ -4,10 +4,14 @@ import base64
 import hashlib
 import hmac
 import secrets
-import struct
 import time
 from typing import Optional, Union
 
+try:
+    from ._wsmask import mask as _c_mask
+except ImportError:  # the C accelerator is optional; apply_mask falls back to Python
+    _c_mask = None
+
 __all__ = [
     "BytesLike",
     "GUID",
@@ -22,6 +26,9 @@ __all__ = [
 BytesLike = Union[bytes, bytearray, memoryview]
 
 GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_GUID_BYTES = GUID.encode()
+
+_ZERO_MASK = b"\x00\x00\x00\x00"
 
 
 def generate_key() -> str:
@@ -55,8 +62,9 @@ def compute_accept_key(key: str) -> str:
     except Exception as e:
         raise ValueError(f"Invalid key format: {e}")
 
-    accept = hashlib.sha1((key + GUID).encode()).digest()
-    return base64.b64encode(accept).decode()
+    accept = hashlib.sha1(key.encode())
+    accept.update(_GUID_BYTES)
+    return base64.b64encode(accept.digest()).decode()
 
 
 def apply_mask(data: BytesLike, mask: bytes) -> bytes:
@@ -71,30 +79,22 @@ def apply_mask(data: BytesLike, mask: bytes) -> bytes:
     :rtype: bytes
     :raises ValueError: If mask is not exactly 4 bytes
     """
+    if mask == _ZERO_MASK:
+        # XOR with a zero key leaves the data unchanged.
+        return bytes(data)
+
+    if _c_mask is not None:
+        return _c_mask(data, mask)
+
     if len(mask) != 4:
         raise ValueError("Mask must be exactly 4 bytes")
 
-    data = bytes(data)  # Convert any bytes-like object to bytes
     data_len = len(data)
-
-    # Optimize for small messages
-    if data_len < 128:
-        return bytes(b ^ mask[i % 4] for i, b in enumerate(data))
-
-    # For larger messages, use the struct module for better performance
-    mask_int = struct.unpack("!I", mask)[0]
-    chunks = [data[i: i + 4] for i in range(0, data_len - data_len % 4, 4)]
-    result = bytearray()
-
-    for chunk in chunks:
-        chunk_int = struct.unpack("!I", chunk)[0]
-        result.extend(struct.pack("!I", chunk_int ^ mask_int))
-
-    # Handle remaining bytes
-    for i in range(data_len - data_len % 4, data_len):
-        result.append(data[i] ^ mask[i % 4])
-
-    return bytes(result)
+    # XOR the whole payload at once as one big integer against the mask repeated
+    # to the same length, rather than byte by byte or word by word.
+    mask_bytes = bytes(mask) * (data_len // 4 + 1)
+    masked = int.from_bytes(data, "big") ^ int.from_bytes(mask_bytes[:data_len], "big")
+    return masked.to_bytes(data_len, "big")
 
 
 class Deadline:
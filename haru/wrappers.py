@@ -8,12 +8,280 @@ They handle both synchronous and asynchronous contexts, adapting their behavior
 """
 
 import asyncio
-from typing import IO, Optional, AsyncIterator, Iterator, Union
+import contextlib
+import functools
+import io
+import mimetypes
+import os
+import threading
+from concurrent.futures import Executor
+from email.utils import formatdate
+from typing import IO, BinaryIO, Callable, Optional, AsyncIterator, Iterator, Tuple, Union
 
 from .response import Response
 
 __all__ = ["FileWrapper", "BytesWrapper"]
 
+# Number of chunks the reading thread of an async iteration may be ahead by.
+_PREFETCH_CHUNKS = 4
+
+# Bounds of the chunk size picked from the size of the content.
+_MIN_AUTO_CHUNK_SIZE = 64 * 1024
+_MAX_AUTO_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are dropped from the page cache once streamed.
+_DROP_CACHE_SIZE = 256 * 1024 * 1024
+
+
+def _auto_chunk_size(size: Optional[int]) -> int:
+    """
+    Pick a chunk size for content of a given size: content up to the minimum
+    chunk size is read at once, larger content in fewer, larger chunks.
+
+    :param size: The size of the content, or None if unknown.
+    :type size: Optional[int]
+    :return: The chunk size.
+    :rtype: int
+    """
+    if size is None:
+        return _MIN_AUTO_CHUNK_SIZE
+    return min(max(size, _MIN_AUTO_CHUNK_SIZE), _MAX_AUTO_CHUNK_SIZE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_content_type(filepath: str) -> str:
+    """
+    Guess the MIME type of a file from its extension, once per path.
+
+    :param filepath: The path to the file.
+    :type filepath: str
+    :return: The MIME type, or ``application/octet-stream`` if it is unknown.
+    :rtype: str
+    """
+    return mimetypes.guess_type(filepath)[0] or "application/octet-stream"
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_validators(size: int, mtime_ns: int) -> Tuple[str, str]:
+    """
+    Build the ``ETag`` and ``Last-Modified`` header values of a file version.
+    They only depend on its size and modification time, so repeated requests
+    for an unchanged file reuse the same strings.
+
+    :param size: The size of the file.
+    :type size: int
+    :param mtime_ns: The modification time of the file in nanoseconds.
+    :type mtime_ns: int
+    :return: The entity tag and the HTTP date of the last modification.
+    :rtype: Tuple[str, str]
+    """
+    etag = f'"{mtime_ns:x}-{size:x}"'
+    return etag, formatdate(mtime_ns / 1e9, usegmt=True)
+
+
+def _parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse the value of a Range header asking for a single range of bytes.
+
+    :param range_header: The value of the Range header.
+    :type range_header: str
+    :param size: The size of the content.
+    :type size: int
+    :return: The start and end (exclusive) of the range, an empty range if it is
+        not satisfiable, or None if the header is invalid or asks for several ranges.
+    :rtype: Optional[Tuple[int, int]]
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = spec.strip().partition("-")
+    if not dash or not (first + last).isdigit() or not first.isascii() or not last.isascii():
+        return None
+    if not first:
+        # A suffix range: the last bytes of the content.
+        return max(size - int(last), 0), size
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        return size, size
+    end = min(int(last) + 1, size) if last else size
+    return start, end
+
+
+def _limit_read(read: Callable[[int], bytes], length: int) -> Callable[[int], bytes]:
+    """
+    Wrap a read function so that it returns no more than a total number of bytes.
+
+    :param read: The read function.
+    :type read: Callable[[int], bytes]
+    :param length: The number of bytes to read in total.
+    :type length: int
+    :return: A read function returning empty bytes once the limit is reached.
+    :rtype: Callable[[int], bytes]
+    """
+    remaining = length
+
+    def limited(chunk_size: int) -> bytes:
+        nonlocal remaining
+        if remaining <= 0:
+            return b""
+        data = read(min(chunk_size, remaining))
+        remaining -= len(data)
+        return data
+
+    return limited
+
+
+def _remaining_size(fileobj: IO[bytes]) -> Optional[int]:
+    """
+    Get the number of bytes left to read in a stream, if it is seekable.
+
+    :param fileobj: The stream.
+    :type fileobj: IO[bytes]
+    :return: The number of bytes from the current position to the end, or None.
+    :rtype: Optional[int]
+    """
+    try:
+        if not fileobj.seekable():
+            return None
+        position = fileobj.tell()
+        end = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(position)
+    except (AttributeError, OSError):
+        return None
+    return end - position
+
+
+def _fadvise(f: BinaryIO, advice: int) -> None:
+    """
+    Give the kernel advice about how the whole of an open file will be accessed.
+
+    :param f: The open file.
+    :type f: BinaryIO
+    :param advice: One of the ``os.POSIX_FADV_*`` constants.
+    :type advice: int
+    """
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        # Only a hint; some file systems and special files do not take it.
+        pass
+
+
+@contextlib.contextmanager
+def _open_for_streaming(filepath: str) -> Iterator[BinaryIO]:
+    """
+    Open a file to be read once from start to end in chunks.
+
+    The file is unbuffered, as each chunk is read straight into a new bytes object
+    without going through the buffer of an io.BufferedReader first, and the kernel
+    is told that it will be read sequentially, so it reads further ahead. Once a
+    very large file has been streamed, its pages are dropped from the page cache
+    so that it does not push out files that are served more often.
+
+    :param filepath: The path to the file.
+    :type filepath: str
+    :return: A context manager giving the open file and closing it on exit.
+    :rtype: Iterator[BinaryIO]
+    """
+    with open(filepath, "rb", buffering=0) as f:
+        if not hasattr(os, "posix_fadvise"):
+            yield f
+            return
+        _fadvise(f, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            yield f
+        finally:
+            if f.tell() >= _DROP_CACHE_SIZE:
+                _fadvise(f, os.POSIX_FADV_DONTNEED)
+
+
+async def _read_in_thread(
+    read: Callable[[int], bytes], chunk_size: int, executor: Optional[Executor] = None
+) -> AsyncIterator[bytes]:
+    """
+    Read chunks in a single executor job that stays a few chunks ahead of the
+    consumer, instead of dispatching every read to the executor on its own.
+
+    The job ends when it is far enough ahead, and is submitted again once the
+    consumer has caught up, so that a slow consumer, such as a download to a slow
+    client, does not keep a worker of the executor waiting on it.
+
+    :param read: The blocking read function.
+    :type read: Callable[[int], bytes]
+    :param chunk_size: The size of the chunks to read.
+    :type chunk_size: int
+    :param executor: The executor to read in, or None for the default executor of the loop.
+    :type executor: Optional[Executor]
+    :return: An asynchronous generator yielding the chunks until the end of data.
+    :rtype: AsyncIterator[bytes]
+    """
+    loop = asyncio.get_running_loop()
+    chunks: "asyncio.Queue[Union[bytes, BaseException]]" = asyncio.Queue()
+    # Guards free_slots and paused, shared by the reader and the consumer.
+    lock = threading.Lock()
+    # Number of chunks the reader may still read ahead.
+    free_slots = _PREFETCH_CHUNKS
+    # Whether the reader ended because it ran out of free slots.
+    paused = False
+    stopped = threading.Event()
+
+    def produce() -> None:
+        nonlocal free_slots, paused
+        while not stopped.is_set():
+            with lock:
+                if not free_slots:
+                    paused = True
+                    return
+                free_slots -= 1
+            try:
+                data: Union[bytes, BaseException] = read(chunk_size)
+            except Exception as exc:
+                data = exc
+            loop.call_soon_threadsafe(chunks.put_nowait, data)
+            if not isinstance(data, bytes) or not data:
+                return
+
+    producer = loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            data = await chunks.get()
+            with lock:
+                free_slots += 1
+                resume, paused = paused, False
+            if resume:
+                producer = loop.run_in_executor(executor, produce)
+            if isinstance(data, BaseException):
+                raise data
+            if not data:
+                break
+            yield data
+    finally:
+        # Stop the reader and wait for it, so the caller may close the file.
+        stopped.set()
+        await producer
+
+
+@contextlib.asynccontextmanager
+async def _aclosing(chunks: AsyncIterator[bytes]) -> AsyncIterator[AsyncIterator[bytes]]:
+    """
+    Close an asynchronous generator on exit, like ``contextlib.aclosing`` of Python 3.10.
+
+    Leaving an ``async for`` loop early does not close the generator it iterates, so
+    the ``finally`` clause of ``_read_in_thread`` would only run once the generator
+    is garbage collected, after the file it reads has been closed.
+
+    :param chunks: The asynchronous generator.
+    :type chunks: AsyncIterator[bytes]
+    :return: A context manager giving the generator and closing it on exit.
+    :rtype: AsyncIterator[AsyncIterator[bytes]]
+    """
+    try:
+        yield chunks
+    finally:
+        await chunks.aclose()  # type: ignore[attr-defined]
+
 
 class FileWrapper(Response):
     """
@@ -21,27 +289,131 @@ class FileWrapper(Response):
     This class inherits from `Response` and can be returned directly from route handlers.
 
     It adapts to both synchronous and asynchronous contexts, handling file I/O appropriately.
+    Where the server supports it (``wsgi.file_wrapper`` under WSGI, the
+    ``http.response.pathsend`` or ``http.response.zerocopysend`` extensions under
+    ASGI), the file is handed to the server instead, which can send it with
+    ``sendfile`` without copying it through Python.
+
+    The ``Content-Length``, ``ETag`` and ``Last-Modified`` headers are set from a
+    single ``stat`` of the file, unless they are given in `headers`. A part of the
+    file can be sent by giving `offset` and `length`; the application narrows full
+    file responses to the range of a ``Range`` request with :meth:`apply_range`.
 
     :param filepath: The path to the file to be wrapped.
     :type filepath: str
-    :param chunk_size: The size of the chunks to read from the file at a time (default is 8192 bytes).
-    :type chunk_size: int
+    :param chunk_size: The size of the chunks to read from the file at a time. By default it
+        follows the file size: the whole file for files up to 64 KiB, up to 1 MiB for larger ones.
+    :type chunk_size: Optional[int]
     :param content_type: The MIME type of the file. If not provided, it will be guessed based on the file extension.
     :type content_type: Optional[str]
     :param headers: Additional headers to include in the response.
     :type headers: Optional[dict]
+    :param inline_size: Files up to this size (default is 64 KiB) are read whole when the response is created
+        and sent as a single body, which costs less than streaming them.
+    :type inline_size: int
+    :param offset: The position in the file to start sending from (default is 0).
+    :type offset: int
+    :param length: The number of bytes to send. If not provided, the file is sent up to its end.
+    :type length: Optional[int]
+    :param executor: The executor to read the file in when iterating asynchronously. If not provided,
+        the application's I/O executor is used, or the default executor of the event loop.
+    :type executor: Optional[Executor]
     """
 
     def __init__(
         self,
         filepath: str,
-        chunk_size: int = 8192,
+        chunk_size: Optional[int] = None,
         content_type: Optional[str] = None,
         headers: Optional[dict] = None,
+        inline_size: int = 64 * 1024,
+        offset: int = 0,
+        length: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ):
-        super().__init__(content_type=content_type, headers=headers)
+        if content_type is None:
+            content_type = _guess_content_type(filepath)
+        super().__init__(None, content_type=content_type, headers=headers)
         self.filepath: str = filepath
-        self.chunk_size: int = chunk_size
+        self.offset: int = offset
+        self.length: Optional[int] = length
+        self.executor: Optional[Executor] = executor
+        self.size: Optional[int] = None
+        window: Optional[int] = None
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            # The error surfaces when the file is opened to be sent.
+            pass
+        else:
+            self.size = st.st_size
+            end = self.size if length is None else min(self.size, offset + length)
+            window = max(end - offset, 0)
+            if window <= inline_size:
+                with open(filepath, "rb") as f:
+                    f.seek(offset)
+                    self.content = f.read(window)
+                window = len(self.content)
+            etag, last_modified = _file_validators(self.size, st.st_mtime_ns)
+            self.headers.setdefault("Content-Length", str(window))
+            self.headers.setdefault("ETag", etag)
+            self.headers.setdefault("Last-Modified", last_modified)
+            self.headers.setdefault("Accept-Ranges", "bytes")
+        self.chunk_size: int = chunk_size or _auto_chunk_size(window)
+
+    def apply_range(self, range_header: str, if_range: Optional[str] = None) -> None:
+        """
+        Narrow a response sending a whole file to the range of bytes asked for by a Range
+        header, making it a 206 Partial Content response, or a 416 Range Not Satisfiable
+        one if the range starts past the end of the file. Headers asking for several
+        ranges, invalid headers and responses that do not send a whole file are left alone.
+
+        :param range_header: The value of the Range header of the request.
+        :type range_header: str
+        :param if_range: The value of the If-Range header of the request, if any. The range
+            is only applied if it matches the ETag or Last-Modified header of the response.
+        :type if_range: Optional[str]
+        """
+        if self.size is None or self.status_code != 200 or self.offset or self.length is not None:
+            return
+        if if_range is not None and if_range not in (
+            self.headers.get("ETag"),
+            self.headers.get("Last-Modified"),
+        ):
+            return
+        window = _parse_range(range_header, self.size)
+        if window is None:
+            return
+        start, end = window
+        if start >= end:
+            self.status_code = 416
+            self.content = b""
+            self.headers["Content-Range"] = f"bytes */{self.size}"
+            self.headers["Content-Length"] = "0"
+            return
+        self.status_code = 206
+        self.offset = start
+        self.length = end - start
+        if self.content is not None:
+            self.content = self.content[start:end]
+        self.headers["Content-Range"] = f"bytes {start}-{end - 1}/{self.size}"
+        self.headers["Content-Length"] = str(self.length)
+
+    def _window_read(self, f: BinaryIO) -> Callable[[int], bytes]:
+        """
+        Position an open file at the start of the part to send and get a read function
+        that stops at its end.
+
+        :param f: The open file.
+        :type f: BinaryIO
+        :return: The read function.
+        :rtype: Callable[[int], bytes]
+        """
+        if self.offset:
+            f.seek(self.offset)
+        if self.length is None:
+            return f.read
+        return _limit_read(f.read, self.length)
 
     def __iter__(self) -> Iterator[bytes]:
         """
@@ -50,35 +422,38 @@ class FileWrapper(Response):
         :return: A generator yielding chunks of file data.
         :rtype: Iterator[bytes]
         """
-        with open(self.filepath, "rb") as f:
-            while True:
-                data = f.read(self.chunk_size)
-                if not data:
-                    break
-                yield data
+        if self.content is not None:
+            yield self.content
+            return
+        with _open_for_streaming(self.filepath) as f:
+            yield from iter(functools.partial(self._window_read(f), self.chunk_size), b"")
 
     async def __aiter__(self) -> AsyncIterator[bytes]:
         """
-        Asynchronously iterate over the file content, yielding chunks of data by offloading I/O to a thread pool.
+        Asynchronously iterate over the file content, yielding chunks of data read ahead by one thread pool job.
 
         :return: An asynchronous generator yielding chunks of file data.
         :rtype: AsyncIterator[bytes]
         """
-        loop = asyncio.get_running_loop()
-        with open(self.filepath, "rb") as f:
-            while True:
-                data = await loop.run_in_executor(None, f.read, self.chunk_size)
-                if not data:
-                    break
-                yield data
+        if self.content is not None:
+            yield self.content
+            return
+        with _open_for_streaming(self.filepath) as f:
+            # The reader thread must be stopped before the file is closed.
+            async with _aclosing(_read_in_thread(self._window_read(f), self.chunk_size, self.executor)) as chunks:
+                async for data in chunks:
+                    yield data
 
     def get_content(self) -> Union[bytes, Iterator[bytes]]:
         """
-        Get the content to be sent in the response. For synchronous contexts, returns an iterator.
+        Get the content to be sent in the response. For synchronous contexts, returns an iterator,
+        or the content itself if the file was small enough to be read when the response was created.
 
         :return: The content of the response.
         :rtype: Union[bytes, Iterator[bytes]]
         """
+        if self.content is not None:
+            return self.content
         return self
 
     async def get_async_content(self) -> AsyncIterator[bytes]:
@@ -100,24 +475,30 @@ class BytesWrapper(Response):
 
     :param fileobj: The file-like object (usually an in-memory byte stream) to be wrapped.
     :type fileobj: IO[bytes]
-    :param chunk_size: The size of the chunks to read from the object at a time (default is 8192 bytes).
-    :type chunk_size: int
+    :param chunk_size: The size of the chunks to read from the object at a time. By default it
+        follows the size of the data left in a seekable stream, as for `FileWrapper`, and is 64 KiB otherwise.
+    :type chunk_size: Optional[int]
     :param content_type: The MIME type of the content.
     :type content_type: Optional[str]
     :param headers: Additional headers to include in the response.
     :type headers: Optional[dict]
+    :param executor: The executor to read the object in when iterating asynchronously. If not provided,
+        the application's I/O executor is used, or the default executor of the event loop.
+    :type executor: Optional[Executor]
     """
 
     def __init__(
         self,
         fileobj: IO[bytes],
-        chunk_size: int = 8192,
+        chunk_size: Optional[int] = None,
         content_type: Optional[str] = None,
         headers: Optional[dict] = None,
+        executor: Optional[Executor] = None,
     ):
-        super().__init__(content_type=content_type, headers=headers)
+        super().__init__(None, content_type=content_type, headers=headers)
         self.fileobj: IO[bytes] = fileobj
-        self.chunk_size: int = chunk_size
+        self.executor: Optional[Executor] = executor
+        self.chunk_size: int = chunk_size or _auto_chunk_size(_remaining_size(fileobj))
 
     def __iter__(self) -> Iterator[bytes]:
         """
@@ -126,25 +507,23 @@ class BytesWrapper(Response):
         :return: A generator yielding chunks of byte data.
         :rtype: Iterator[bytes]
         """
-        while True:
-            data = self.fileobj.read(self.chunk_size)
-            if not data:
-                break
-            yield data
+        yield from iter(functools.partial(self.fileobj.read, self.chunk_size), b"")
 
     async def __aiter__(self) -> AsyncIterator[bytes]:
         """
-        Asynchronously iterate over the byte stream, yielding chunks of data by offloading I/O to a thread pool.
+        Asynchronously iterate over the byte stream, yielding chunks of data read ahead by one thread pool job.
+        An in-memory stream never blocks, so it is read directly instead.
 
         :return: An asynchronous generator yielding chunks of byte data.
         :rtype: AsyncIterator[bytes]
         """
-        loop = asyncio.get_running_loop()
-        while True:
-            data = await loop.run_in_executor(None, self.fileobj.read, self.chunk_size)
-            if not data:
-                break
-            yield data
+        if isinstance(self.fileobj, io.BytesIO):
+            for data in self:
+                yield data
+            return
+        async with _aclosing(_read_in_thread(self.fileobj.read, self.chunk_size, self.executor)) as chunks:
+            async for data in chunks:
+                yield data
 
     def get_content(self) -> Union[bytes, Iterator[bytes]]:
         """
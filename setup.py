@@ -1,6 +1,6 @@
 import codecs
 import os.path
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 
 
 def read(rel_path):
@@ -18,11 +18,38 @@ def get_version(rel_path):
         raise RuntimeError("Unable to find version string.")
 
 
+def get_ext_modules():
+    # The WebSocket masking accelerator is optional: if it fails to compile,
+    # the package installs without it and uses the pure-Python implementation.
+    ext_modules = [
+        Extension(
+            "haru.websocket._wsmask",
+            ["haru/websocket/_wsmask.c"],
+            optional=True,
+        )
+    ]
+
+    # Opt-in: compile the pure-Python UI modules with Cython when building with
+    # HARU_CYTHONIZE=1. The .py sources stay in the package as the fallback.
+    # Annotations are not used as C types: Cython would then require exact
+    # builtin types, while properties annotated as List or Dict return the
+    # list and dict subclasses that track changes to an element.
+    if os.environ.get("HARU_CYTHONIZE") == "1":
+        from Cython.Build import cythonize
+
+        ext_modules += cythonize(
+            ["haru/ui/element.py", "haru/ui/page.py"],
+            compiler_directives={"language_level": "3", "annotation_typing": False},
+        )
+    return ext_modules
+
+
 setup(
     name="haru",
     version=get_version("haru/__init__.py"),
     description="The Python framework for web applications.",
     author="t3tra",
     packages=find_packages(),
+    ext_modules=get_ext_modules(),
     license="MIT",
 )
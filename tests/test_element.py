@@ -0,0 +1,122 @@
+import copy
+import pickle
+
+import pytest
+
+from haru.ui.element import Br, Div, P, Span
+
+
+class Card(Div):
+    __slots__ = ()
+
+    def render(self) -> str:
+        return f"<section>{super().render()}</section>"
+
+
+def test_nested_child_render_override_is_used():
+    page = Div(Card("x"), P("y"))
+    assert page.render() == "<div><section><div>x</div></section><p>y</p></div>"
+    assert page.render_bytes() == page.render().encode()
+
+
+def test_render_override_is_used_by_render_to_and_render_bytes():
+    card = Card("x")
+    card.render()
+    fragments = []
+    card.render_to(fragments.append)
+    assert "".join(fragments) == "<section><div>x</div></section>"
+    assert card.render_bytes() == b"<section><div>x</div></section>"
+
+
+def test_shared_child_stays_in_every_parent():
+    nav = P("n")
+    first = Div(nav)
+    second = Div(nav)
+    assert first.render() == "<div><p>n</p></div>"
+    assert second.render() == "<div><p>n</p></div>"
+    nav.children.append("!")
+    assert nav.parent is second
+    assert first.render() == "<div><p>n!</p></div>"
+    assert second.render() == "<div><p>n!</p></div>"
+
+
+def test_child_with_render_override_is_rendered_every_time():
+    class Counter(Span):
+        __slots__ = ("calls",)
+
+        def render(self) -> str:
+            self.calls = getattr(self, "calls", 0) + 1
+            return f"<span>{self.calls}</span>"
+
+    page = Div(Counter())
+    assert page.render() == "<div><span>1</span></div>"
+    assert page.render() == "<div><span>2</span></div>"
+
+
+def test_text_that_is_not_a_str_is_rendered_every_time():
+    class Clock:
+        ticks = 0
+
+        def __str__(self) -> str:
+            Clock.ticks += 1
+            return str(Clock.ticks)
+
+    page = Div(P(Clock()))
+    assert page.render() == "<div><p>1</p></div>"
+    assert page.render() == "<div><p>2</p></div>"
+
+
+def test_copied_element_keeps_its_own_cache_valid():
+    child = P("a")
+    original = Div(child)
+    copied = copy.copy(original)
+    original.render()
+    copied.render()
+    child.children.append("!")
+    copied.children[0].children.append("?")
+    assert copied.children[0] is not child
+    assert original.render() == "<div><p>a!</p></div>"
+    assert copied.render() == "<div><p>a?</p></div>"
+
+
+def test_removed_child_is_detached_and_can_be_released():
+    parent = Div(P("a"), P("b"), P("c"), P("d"))
+    removed = [parent.children.pop(), parent.children[0]]
+    parent.children.remove(removed[1])
+    del parent.children[0]
+    removed.append(parent.children[0])
+    parent.children.clear()
+    assert all(child.parent is None for child in removed)
+    removed[0].release()
+    assert parent.render() == "<div></div>"
+
+
+def test_release_tolerates_a_stale_parent_and_a_second_release():
+    child = P("a")
+    parent = Div(child)
+    parent.children = []
+    child.parent = parent
+    child.release()
+    child.release()
+    first, second = P.acquire("x"), P.acquire("y")
+    assert first is not second
+
+
+def test_release_keeps_children_shared_with_other_elements():
+    header = P("shared")
+    page = Div(header)
+    other = Div(header)
+    page.release()
+    assert header.parent is other
+    assert other.render() == "<div><p>shared</p></div>"
+
+
+def test_shared_empty_attributes_cannot_be_modified():
+    first, second = Br(), Br()
+    with pytest.raises(TypeError):
+        first._attributes["id"] = "x"
+    first.attributes["id"] = "x"
+    assert second.render() == "<br />"
+    copied = pickle.loads(pickle.dumps(second))
+    assert copied._attributes is second._attributes
+    assert copy.deepcopy(Div(P("a"))).render() == "<div><p>a</p></div>"
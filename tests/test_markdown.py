@@ -0,0 +1,33 @@
+from haru.ui.utils import Markdown
+
+
+def test_pipe_line_without_delimiter_row_is_text():
+    assert Markdown("| a |\nplain").render() == (
+        '<div class="markdown"><div>| a | plain</div></div>'
+    )
+    assert Markdown("| a |").render() == '<div class="markdown"><div>| a |</div></div>'
+
+
+def test_table_with_delimiter_row():
+    assert Markdown("| a | b |\n|:-|-:|\n| 1 | 2 |").render() == (
+        '<div class="markdown"><table>'
+        '<tr><td style="text-align: left">a</td><td style="text-align: right">b</td></tr>'
+        "<tr><td>1</td><td>2</td></tr>"
+        "</table></div>"
+    )
+
+
+def test_subclass_parser_is_used_for_text_and_files(tmp_path):
+    class Shouting(Markdown):
+        __slots__ = ()
+
+        @classmethod
+        def _apply_inline_formatting(cls, text: str) -> str:
+            return super()._apply_inline_formatting(text).upper()
+
+    Markdown("hello")
+    path = tmp_path / "doc.md"
+    path.write_text("hello")
+    assert Shouting("hello").render() == Shouting.from_file(str(path)).render()
+    assert "HELLO" in Shouting("hello").render()
+    assert "hello" in Markdown("hello").render()
@@ -0,0 +1,33 @@
+from haru.ui.element import Meta, Title
+from haru.ui.page import Page
+
+
+class PageTitle(Title):
+    __slots__ = ()
+
+
+def test_dispatch_info_finds_head_elements_added_directly():
+    page = Page(PageTitle("old"))
+    page.head.children.append(Meta(attributes={"name": "description", "content": "a"}))
+    page.dispatch_info(title="new", description="b")
+    assert len(page.query_selector_all("title")) == 1
+    assert page.query_selector("title").render() == "<title>new</title>"
+    descriptions = [
+        meta
+        for meta in page.query_selector_all("meta")
+        if meta.attributes.get("name") == "description"
+    ]
+    assert len(descriptions) == 1
+    assert descriptions[0].attributes["content"] == "b"
+
+
+def test_dispatch_info_skips_head_elements_removed_or_renamed():
+    page = Page(Title("old"))
+    page.dispatch_info(title="first", description="a")
+    page.head.children.remove(page.query_selector("title"))
+    meta = page._find_meta("description")
+    meta.attributes["name"] = "keywords"
+    page.dispatch_info(title="second", description="b")
+    assert page.query_selector("title").render() == "<title>second</title>"
+    assert meta.attributes["content"] == "a"
+    assert page._find_meta("description").attributes["content"] == "b"
@@ -0,0 +1,108 @@
+import asyncio
+import io
+
+import pytest
+
+from haru import FileWrapper, Haru
+
+SIZE = 300 * 1024
+
+
+@pytest.fixture(scope="module")
+def data():
+    return bytes(range(256)) * (SIZE // 256)
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory, data):
+    path = tmp_path_factory.mktemp("ranges") / "file.bin"
+    path.write_bytes(data)
+    return str(path)
+
+
+def wsgi_get(path, headers):
+    app = Haru(__name__)
+    app.route("/file")(lambda request: FileWrapper(path))
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/file", "wsgi.input": io.BytesIO()}
+    for name, value in headers.items():
+        environ["HTTP_" + name.upper().replace("-", "_")] = value
+    started = {}
+
+    def start_response(status, response_headers, exc_info=None):
+        started["status"] = int(status.split()[0])
+        started["headers"] = {name.title(): value for name, value in response_headers}
+
+    result = app.wsgi_app(environ, start_response)
+    try:
+        body = b"".join(result)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+    return started["status"], started["headers"], body
+
+
+def asgi_get(path, headers):
+    app = Haru(__name__, asgi=True)
+    app.route("/file")(lambda request: FileWrapper(path))
+    asgi = app.asgi_app()
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/file",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asgi(scope, receive, send))
+    start = messages[0]
+    response_headers = {name.decode().title(): value.decode() for name, value in start["headers"]}
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], response_headers, body
+
+
+@pytest.fixture(params=[wsgi_get, asgi_get], ids=["wsgi", "asgi"])
+def get(request, path):
+    return lambda headers: request.param(path, headers)
+
+
+def test_range(get, data):
+    status, headers, body = get({"Range": "bytes=100-199"})
+    assert status == 206
+    assert headers["Content-Range"] == f"bytes 100-199/{SIZE}"
+    assert body == data[100:200]
+
+
+def test_suffix_range(get, data):
+    status, headers, body = get({"Range": "bytes=-300"})
+    assert status == 206
+    assert headers["Content-Range"] == f"bytes {SIZE - 300}-{SIZE - 1}/{SIZE}"
+    assert body == data[-300:]
+
+
+def test_unsatisfiable_range(get):
+    status, headers, _ = get({"Range": f"bytes={SIZE}-"})
+    assert status == 416
+    assert headers["Content-Range"] == f"bytes */{SIZE}"
+
+
+def test_multiple_ranges_are_ignored(get, data):
+    status, headers, body = get({"Range": "bytes=1-2,5-6"})
+    assert status == 200
+    assert "Content-Range" not in headers
+    assert body == data
+
+
+def test_if_range(get, data):
+    _, headers, _ = get({})
+    status, _, body = get({"Range": "bytes=1-2", "If-Range": '"other"'})
+    assert status == 200
+    assert body == data
+    status, _, body = get({"Range": "bytes=1-2", "If-Range": headers["Etag"]})
+    assert status == 206
+    assert body == data[1:3]